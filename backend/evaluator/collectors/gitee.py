@@ -9,6 +9,7 @@ import re
 import os
 import json
 import hashlib
+import requests
 from datetime import datetime
 from pathlib import Path
 
@@ -365,7 +366,6 @@ class GiteeCollector:
         Returns:
             Detailed commit data including files changed and diffs
         """
-        import requests
 
         # Use appropriate API base URL
         base_url = self.enterprise_base_url if is_enterprise else self.base_url
@@ -412,7 +412,6 @@ class GiteeCollector:
         Returns:
             List of commit summaries
         """
-        import requests
 
         # Use appropriate API base URL
         base_url = self.enterprise_base_url if is_enterprise else self.base_url
@@ -603,8 +602,6 @@ class GiteeCollector:
             return cached_data.get("data", cached_data)
 
         # Make API request
-        import requests
-
         # Use appropriate API base URL
         base_url = self.enterprise_base_url if is_enterprise else self.base_url
         api_url = f"{base_url}/repos/{owner}/{repo}/collaborators"
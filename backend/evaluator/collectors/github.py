@@ -9,6 +9,7 @@ import re
 import os
 import json
 import hashlib
+import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -269,7 +270,6 @@ class GitHubCollector:
         Returns:
             Detailed commit data including files changed and diffs
         """
-        import requests
 
         api_url = f"{self.base_url}/repos/{owner}/{repo}/commits/{commit_sha}"
         print(f"[API] Fetching commit data from {api_url}")
@@ -299,7 +299,6 @@ class GitHubCollector:
         Returns:
             List of commit summaries
         """
-        import requests
 
         api_url = f"{self.base_url}/repos/{owner}/{repo}/commits"
         params = {"per_page": min(limit, 100)}
@@ -5,6 +5,7 @@ from evaluator.config.tokens import (
     get_gitee_token,
     get_llm_api_key,
     mask_secret,
+    clear_token_cache,
     DEFAULT_LLM_MODEL,
 )
 from evaluator.config.env import (
@@ -19,6 +20,7 @@ __all__ = [
     "get_gitee_token",
     "get_llm_api_key",
     "mask_secret",
+    "clear_token_cache",
     "DEFAULT_LLM_MODEL",
     "get_user_env_path",
     "parse_env_file",
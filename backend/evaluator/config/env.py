@@ -1,10 +1,12 @@
 """Environment variable and configuration file management."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
 from evaluator.paths import get_home_dir
+from evaluator.config.tokens import clear_token_cache
 
 
 def get_user_env_path() -> Path:
@@ -13,7 +15,27 @@ def get_user_env_path() -> Path:
 
 
 def parse_env_file(path: Path) -> Dict[str, str]:
-    """Parse .env file into dictionary."""
+    """
+    Parse .env file into dictionary.
+
+    Parsed content is memoized by (path, mtime_ns); callers get a fresh copy they may mutate.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    except OSError:
+        return _read_env_file(path)
+    return dict(_parse_env_file_cached(str(path), mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _parse_env_file_cached(path: str, mtime_ns: int) -> Dict[str, str]:
+    _ = mtime_ns
+    return _read_env_file(Path(path))
+
+
+def _read_env_file(path: Path) -> Dict[str, str]:
     env: Dict[str, str] = {}
     try:
         for raw in path.read_text(encoding="utf-8").splitlines():
@@ -74,3 +96,4 @@ def apply_env_to_process(env: Dict[str, str]) -> None:
             os.environ.pop(k, None)
         else:
             os.environ[k] = v
+    clear_token_cache()
@@ -1,20 +1,40 @@
 """Token management and secret masking utilities."""
 
 import os
-from typing import Optional
+import time
+from typing import Callable, Dict, Optional, Tuple
 
 # Default model for evaluation (can be overridden per-request by query param `model=...`)
 DEFAULT_LLM_MODEL = os.getenv("OSCANNER_LLM_MODEL", "qwen/qwen3-coder-flash")
 
+# Resolved secrets are cached briefly; apply_env_to_process() clears the cache on config writes.
+_TOKEN_TTL_SECONDS = 30.0
+_token_cache: Dict[str, Tuple[Optional[str], float]] = {}
+
+
+def _cached_token(name: str, resolve: Callable[[], Optional[str]]) -> Optional[str]:
+    now = time.monotonic()
+    hit = _token_cache.get(name)
+    if hit is not None and hit[1] > now:
+        return hit[0]
+    value = resolve()
+    _token_cache[name] = (value, now + _TOKEN_TTL_SECONDS)
+    return value
+
+
+def clear_token_cache() -> None:
+    """Forget cached token lookups (call after changing process env)."""
+    _token_cache.clear()
+
 
 def get_github_token() -> Optional[str]:
-    """Read from process env at call time so dashboard updates take effect without restart."""
-    return os.getenv("GITHUB_TOKEN")
+    """Read from process env (short TTL cache) so dashboard updates take effect without restart."""
+    return _cached_token("GITHUB_TOKEN", lambda: os.getenv("GITHUB_TOKEN"))
 
 
 def get_gitee_token() -> Optional[str]:
-    """Read from process env at call time so dashboard updates take effect without restart."""
-    return os.getenv("GITEE_TOKEN")
+    """Read from process env (short TTL cache) so dashboard updates take effect without restart."""
+    return _cached_token("GITEE_TOKEN", lambda: os.getenv("GITEE_TOKEN"))
 
 
 def get_llm_api_key() -> Optional[str]:
@@ -26,11 +46,11 @@ def get_llm_api_key() -> Optional[str]:
     - OPENAI_API_KEY
     - OPEN_ROUTER_KEY
     """
-    return (
+    return _cached_token("llm_api_key", lambda: (
         os.getenv("OSCANNER_LLM_API_KEY")
         or os.getenv("OPENAI_API_KEY")
         or os.getenv("OPEN_ROUTER_KEY")
-    )
+    ))
 
 
 def mask_secret(value: Optional[str]) -> str:
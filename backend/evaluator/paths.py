@@ -1,12 +1,7 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-
-
-def _xdg_dir(env_key: str, fallback: Path) -> Path:
-    value = os.getenv(env_key)
-    if value:
-        return Path(value).expanduser()
-    return fallback
+from typing import Optional
 
 
 def get_home_dir() -> Path:
@@ -18,10 +13,18 @@ def get_home_dir() -> Path:
     2) XDG_DATA_HOME/oscanner
     3) ~/.local/share/oscanner
     """
-    if os.getenv("OSCANNER_HOME"):
-        return Path(os.environ["OSCANNER_HOME"]).expanduser()
-    data_home = _xdg_dir("XDG_DATA_HOME", Path.home() / ".local" / "share")
-    return data_home / "oscanner"
+    return _home_dir_for(os.getenv("OSCANNER_HOME"), os.getenv("XDG_DATA_HOME"), os.getenv("HOME"))
+
+
+@lru_cache(maxsize=8)
+def _home_dir_for(oscanner_home: Optional[str], xdg_data_home: Optional[str], home: Optional[str]) -> Path:
+    # Keyed on the env values it depends on (HOME for Path.home()), so runtime env changes still apply
+    _ = home
+    if oscanner_home:
+        return Path(oscanner_home).expanduser()
+    if xdg_data_home:
+        return Path(xdg_data_home).expanduser() / "oscanner"
+    return Path.home() / ".local" / "share" / "oscanner"
 
 
 def get_data_dir() -> Path:
@@ -29,11 +32,17 @@ def get_data_dir() -> Path:
     Get base data directory (without platform structure).
     For new code, use get_platform_data_dir() instead.
     """
-    if os.getenv("OSCANNER_DATA_DIR"):
-        return Path(os.environ["OSCANNER_DATA_DIR"]).expanduser()
+    data_dir = os.getenv("OSCANNER_DATA_DIR")
+    if data_dir:
+        return _expand_dir(data_dir)
     return get_home_dir() / "data"
 
 
+@lru_cache(maxsize=8)
+def _expand_dir(value: str) -> Path:
+    return Path(value).expanduser()
+
+
 def get_platform_data_dir(platform: str, owner: str, repo: str) -> Path:
     """
     Get platform-specific data directory for a repository.
@@ -112,16 +121,29 @@ def get_trajectory_cache_path(username: str) -> Path:
     """
     cache_dir = get_trajectory_cache_dir()
     cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"{_normalize_cache_username(username)}.json"
+
 
+def get_commits_by_date_cache_path(username: str) -> Path:
+    """
+    Get the commits-by-date sidecar cache path for a user or group of users.
+
+    Args:
+        username: Username or comma-separated list of usernames (normalized like
+                 get_trajectory_cache_path)
+
+    Returns:
+        Path: home/track/commits_by_date/{author1,author2,...}.json
+    """
+    cache_dir = get_trajectory_cache_dir() / "commits_by_date"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"{_normalize_cache_username(username)}.json"
+
+
+def _normalize_cache_username(username: str) -> str:
     # If username contains commas, split and sort authors for consistent cache key
     if ',' in username:
         authors = [a.strip() for a in username.split(',')]
         # Sort authors alphabetically for order-insensitive caching
-        sorted_authors = sorted(authors)
-        normalized_username = ','.join(sorted_authors)
-    else:
-        normalized_username = username.strip()
-
-    return cache_dir / f"{normalized_username}.json"
-
-
+        return ','.join(sorted(authors))
+    return username.strip()
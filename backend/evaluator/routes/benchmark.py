@@ -1,8 +1,12 @@
 """Benchmark and validation routes."""
 
-import json
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from types import ModuleType
+from typing import Dict, Any, List, Optional, Tuple
+import anyio
 from fastapi import APIRouter, HTTPException, Query
 
 # Import validation modules
@@ -21,6 +25,8 @@ from evaluator.utils import load_commits_from_local
 from evaluator.services import (
     resolve_plugin_id,
     get_evaluation_cache_path,
+    load_evaluation_cache,
+    save_evaluation_cache,
     get_plugins_snapshot,
     evaluate_author_incremental,
     extract_github_data,
@@ -29,6 +35,10 @@ from evaluator.services import (
 
 router = APIRouter()
 
+# In-flight evaluations keyed by (repo_url, author, plugin_id, model); concurrent
+# identical requests await the first one instead of re-running the LLM evaluation.
+_inflight: Dict[Tuple[str, str, str, str], "asyncio.Task[Dict[str, Any]]"] = {}
+
 
 async def extract_commits_from_platform(platform: str, owner: str, repo: str):
     """
@@ -47,6 +57,51 @@ async def extract_commits_from_platform(platform: str, owner: str, repo: str):
         raise ValueError(f"Unsupported platform: {platform}")
 
 
+@dataclass(frozen=True)
+class _RepoContext:
+    """Repo-level evaluation setup shared by all authors of one repository."""
+
+    scan_mod: ModuleType
+    data_dir: Path
+    eval_dir: Path
+    commits: List[Dict[str, Any]]
+    default_plugin_id: Optional[str]
+
+
+def _data_version(data_dir: Path) -> int:
+    """Return a cheap version stamp for the repo data dir (mtime of commits_index.json)."""
+    try:
+        return (data_dir / "commits_index.json").stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+# Benchmarks walk the dataset repo by repo, so only the current few repos' commit lists
+# are worth keeping in memory
+@lru_cache(maxsize=4)
+def _get_repo_context(platform: str, owner: str, repo: str, plugin_id: str, data_version: int) -> _RepoContext:
+    """
+    Build the repo-level part of a benchmark evaluation once per repo.
+
+    `data_version` is part of the cache key so re-extracted data invalidates the entry.
+    Credentials and model stay out of the key; the evaluator is built per call.
+    """
+    _ = data_version
+    try:
+        _, scan_mod, _ = load_scan_module(plugin_id)
+    except PluginLoadError as e:
+        raise ValueError(f"Plugin load error: {e}")
+
+    data_dir = get_platform_data_dir(platform, owner, repo)
+    return _RepoContext(
+        scan_mod=scan_mod,
+        data_dir=data_dir,
+        eval_dir=get_platform_eval_dir(platform, owner, repo),
+        commits=load_commits_from_local(data_dir, limit=None),
+        default_plugin_id=get_plugins_snapshot()[1],
+    )
+
+
 async def evaluation_function_wrapper(repo_url: str, author: str, plugin_id: str = "", model: str = DEFAULT_LLM_MODEL) -> Dict[str, Any]:
     """
     Wrapper function for ValidationRunner to evaluate a repository/author
@@ -60,6 +115,27 @@ async def evaluation_function_wrapper(repo_url: str, author: str, plugin_id: str
     Returns:
         Evaluation result dictionary
     """
+    key = (repo_url, author, plugin_id, model)
+    task = _inflight.get(key)
+    if task is None:
+        # The evaluation runs as its own task, so cancelling any one caller (the first
+        # included) leaves it running for the others
+        task = asyncio.ensure_future(_evaluate_repo_author(repo_url, author, plugin_id, model))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _evaluation_done(key, t))
+    return await asyncio.shield(task)
+
+
+def _evaluation_done(key: Tuple[str, str, str, str], task: "asyncio.Task[Dict[str, Any]]") -> None:
+    """Forget a finished evaluation; mark its exception retrieved in case every caller left."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+
+async def _evaluate_repo_author(repo_url: str, author: str, plugin_id: str, model: str) -> Dict[str, Any]:
+    """Run a single benchmark evaluation (see evaluation_function_wrapper)."""
     # Parse repo URL
     if "github.com" in repo_url:
         platform = "github"
@@ -75,12 +151,6 @@ async def evaluation_function_wrapper(repo_url: str, author: str, plugin_id: str
     # Resolve plugin
     plugin_id = resolve_plugin_id(plugin_id)
 
-    # Load plugin
-    try:
-        meta, scan_mod, scan_path = load_scan_module(plugin_id)
-    except PluginLoadError as e:
-        raise ValueError(f"Plugin load error: {e}")
-
     # Check/extract data
     data_dir = get_platform_data_dir(platform, owner, repo)
     if not data_dir.exists():
@@ -91,48 +161,42 @@ async def evaluation_function_wrapper(repo_url: str, author: str, plugin_id: str
         except Exception as e:
             raise ValueError(f"Failed to extract data: {e}")
 
-    # Load commits
-    commits = load_commits_from_local(data_dir, limit=None)
-    if not commits:
+    # Get API key
+    api_key = get_llm_api_key()
+    if not api_key:
+        raise ValueError("LLM API key not configured")
+
+    # Repo-level setup is shared by every author of the same repo
+    ctx = _get_repo_context(platform, owner, repo, plugin_id, _data_version(data_dir))
+    if not ctx.commits:
         return {
             "overall_score": 0,
             "dimensions": [],
             "error": "No commits found"
         }
 
-    # Load previous evaluation (for caching)
-    eval_dir = get_platform_eval_dir(platform, owner, repo)
-    default_plugin_id = get_plugins_snapshot()[1]
-    eval_path = get_evaluation_cache_path(eval_dir, author, plugin_id, default_plugin_id)
-
-    previous_evaluation = None
-    if eval_path.exists():
-        try:
-            with open(eval_path, 'r', encoding='utf-8') as f:
-                previous_evaluation = json.load(f)
-        except Exception as e:
-            print(f"[Benchmark] Failed to load cached evaluation: {e}")
-
-    # Get API key
-    api_key = get_llm_api_key()
-    if not api_key:
-        raise ValueError("LLM API key not configured")
-
-    # Create evaluator factory
     def evaluator_factory():
-        return scan_mod.create_commit_evaluator(
-            data_dir=str(data_dir),
+        return ctx.scan_mod.create_commit_evaluator(
+            data_dir=str(ctx.data_dir),
             api_key=api_key,
             model=model,
             mode="moderate",
         )
 
+    # Load previous evaluation (for caching); file I/O runs off the event loop
+    eval_path = get_evaluation_cache_path(ctx.eval_dir, author, plugin_id, ctx.default_plugin_id)
+    previous_evaluation = None
+    try:
+        previous_evaluation = await anyio.to_thread.run_sync(load_evaluation_cache, eval_path)
+    except Exception as e:
+        print(f"[Benchmark] Failed to load cached evaluation: {e}")
+
     # Run evaluation
     result = evaluate_author_incremental(
-        commits=commits,
+        commits=ctx.commits,
         author=author,
         previous_evaluation=previous_evaluation,
-        data_dir=data_dir,
+        data_dir=ctx.data_dir,
         model=model,
         use_chunking=True,
         api_key=api_key,
@@ -141,9 +205,7 @@ async def evaluation_function_wrapper(repo_url: str, author: str, plugin_id: str
     )
 
     # Save evaluation
-    eval_dir.mkdir(parents=True, exist_ok=True)
-    with open(eval_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    await anyio.to_thread.run_sync(save_evaluation_cache, eval_path, result)
 
     return result
 
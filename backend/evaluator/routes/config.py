@@ -3,6 +3,7 @@
 import os
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 
 from evaluator.config import (
@@ -27,20 +28,23 @@ async def get_llm_config():
     Read current LLM config from user dotfile + process env (masked).
     """
     path = get_user_env_path()
-    file_env = parse_env_file(path) if path.exists() else {}
+    file_env = parse_env_file(path)
+    # User dotfile wins over process env; empty dotfile values fall back to the process env.
+    merged = {**os.environ, **{k: v for k, v in file_env.items() if v}}
     api_key = get_llm_api_key()
+    openrouter_key = merged.get("OPEN_ROUTER_KEY")
     cfg = {
         "configured": bool(api_key),
         "path": str(path),
-        "mode": "openrouter" if (file_env.get("OPEN_ROUTER_KEY") or os.getenv("OPEN_ROUTER_KEY")) else "openai",
-        "openrouter_key_masked": mask_secret(file_env.get("OPEN_ROUTER_KEY") or os.getenv("OPEN_ROUTER_KEY")),
-        "oscanner_llm_api_key_masked": mask_secret(file_env.get("OSCANNER_LLM_API_KEY") or os.getenv("OSCANNER_LLM_API_KEY")),
-        "gitee_token_masked": mask_secret(file_env.get("GITEE_TOKEN") or os.getenv("GITEE_TOKEN")),
-        "github_token_masked": mask_secret(file_env.get("GITHUB_TOKEN") or os.getenv("GITHUB_TOKEN")),
-        "oscanner_llm_base_url": file_env.get("OSCANNER_LLM_BASE_URL") or os.getenv("OSCANNER_LLM_BASE_URL") or os.getenv("OPENAI_BASE_URL") or "",
-        "oscanner_llm_chat_completions_url": file_env.get("OSCANNER_LLM_CHAT_COMPLETIONS_URL") or os.getenv("OSCANNER_LLM_CHAT_COMPLETIONS_URL") or "",
-        "oscanner_llm_model": file_env.get("OSCANNER_LLM_MODEL") or os.getenv("OSCANNER_LLM_MODEL") or DEFAULT_LLM_MODEL,
-        "oscanner_llm_fallback_models": file_env.get("OSCANNER_LLM_FALLBACK_MODELS") or os.getenv("OSCANNER_LLM_FALLBACK_MODELS") or "",
+        "mode": "openrouter" if openrouter_key else "openai",
+        "openrouter_key_masked": mask_secret(openrouter_key),
+        "oscanner_llm_api_key_masked": mask_secret(merged.get("OSCANNER_LLM_API_KEY")),
+        "gitee_token_masked": mask_secret(merged.get("GITEE_TOKEN")),
+        "github_token_masked": mask_secret(merged.get("GITHUB_TOKEN")),
+        "oscanner_llm_base_url": merged.get("OSCANNER_LLM_BASE_URL") or merged.get("OPENAI_BASE_URL") or "",
+        "oscanner_llm_chat_completions_url": merged.get("OSCANNER_LLM_CHAT_COMPLETIONS_URL") or "",
+        "oscanner_llm_model": merged.get("OSCANNER_LLM_MODEL") or DEFAULT_LLM_MODEL,
+        "oscanner_llm_fallback_models": merged.get("OSCANNER_LLM_FALLBACK_MODELS") or "",
     }
     return cfg
 
@@ -197,51 +201,54 @@ async def check_platform_tokens(payload: Dict[str, Any]):
     if not isinstance(repo_urls, list) or len(repo_urls) == 0:
         raise HTTPException(status_code=400, detail="repo_urls must be a non-empty list")
     
-    github_token = get_github_token()
-    gitee_token = get_gitee_token()
-    
-    repo_requirements = []
+    token_configured_by_platform = {
+        "github": bool(get_github_token()),
+        "gitee": bool(get_gitee_token()),
+    }
+
+    # Single pass into parallel columns; per-repo dicts are only built for the response.
+    platforms = []
+    configured = []
     missing_platforms = set()
-    
+
     for repo_url in repo_urls:
         parsed = parse_repo_url(repo_url)
         if not parsed:
-            repo_requirements.append({
-                "repo_url": repo_url,
-                "platform": "unknown",
-                "token_configured": False,
-                "token_required": True,
-                "error": "Invalid repository URL format"
-            })
+            platforms.append(None)
+            configured.append(False)
             continue
-        
-        platform, owner, repo = parsed
-        token_configured = False
-        token_required = True
-        
-        if platform == "github":
-            token_configured = bool(github_token)
-            if not token_configured:
-                missing_platforms.add("github")
-        elif platform == "gitee":
-            token_configured = bool(gitee_token)
-            if not token_configured:
-                missing_platforms.add("gitee")
-        
-        repo_requirements.append({
-            "repo_url": repo_url,
+
+        platform = parsed[0]
+        token_configured = token_configured_by_platform.get(platform, False)
+        if not token_configured and platform in token_configured_by_platform:
+            missing_platforms.add(platform)
+        platforms.append(platform)
+        configured.append(token_configured)
+
+    repo_requirements = [
+        {
+            "repo_url": url,
             "platform": platform,
             "token_configured": token_configured,
-            "token_required": token_required
-        })
-    
-    all_configured = len(missing_platforms) == 0
-    
-    return {
-        "all_configured": all_configured,
+            "token_required": True,
+        }
+        if platform is not None
+        else {
+            "repo_url": url,
+            "platform": "unknown",
+            "token_configured": False,
+            "token_required": True,
+            "error": "Invalid repository URL format",
+        }
+        for url, platform, token_configured in zip(repo_urls, platforms, configured)
+    ]
+
+    # Plain JSON payload: skip jsonable_encoder's recursive walk for large batches.
+    return JSONResponse({
+        "all_configured": not missing_platforms,
         "missing_tokens": {
             "github": "github" in missing_platforms,
             "gitee": "gitee" in missing_platforms
         },
         "repo_requirements": repo_requirements
-    }
+    })
@@ -1,6 +1,9 @@
 """Data extraction and author discovery routes."""
 
+import heapq
 import json
+import traceback
+from typing import Optional
 from fastapi import APIRouter, HTTPException, Query
 from pathlib import Path
 
@@ -31,7 +34,13 @@ async def get_gitee_commits(
 
 
 @router.get("/api/authors/{owner}/{repo}")
-async def get_authors(owner: str, repo: str, platform: str = Query("github"), use_cache: bool = Query(True)):
+async def get_authors(
+    owner: str,
+    repo: str,
+    platform: str = Query("github"),
+    use_cache: bool = Query(True),
+    top: Optional[int] = Query(None, ge=1),
+):
     """
     Get list of authors from commit data
 
@@ -39,7 +48,7 @@ async def get_authors(owner: str, repo: str, platform: str = Query("github"), us
     1. Check if local data exists in platform-specific directory
     2. If no local data, extract it from GitHub/Gitee
     3. Load ALL authors from commits (always scans all commits)
-    4. Return complete authors list
+    4. Return authors sorted by commit count (only the top N when `top` is given)
     """
     try:
         data_dir = get_platform_data_dir(platform, owner, repo)
@@ -102,12 +111,15 @@ async def get_authors(owner: str, repo: str, platform: str = Query("github"), us
                 detail=f"No commit authors found in {commits_dir}"
             )
 
-        # Sort by commit count
-        authors_list = sorted(
-            authors_map.values(),
-            key=lambda x: x["commits"],
-            reverse=True
-        )
+        # Sort by commit count (partial selection when only the top N are needed)
+        if top is not None and top < len(authors_map):
+            authors_list = heapq.nlargest(top, authors_map.values(), key=lambda x: x["commits"])
+        else:
+            authors_list = sorted(
+                authors_map.values(),
+                key=lambda x: x["commits"],
+                reverse=True
+            )
 
         return {
             "success": True,
@@ -115,7 +127,7 @@ async def get_authors(owner: str, repo: str, platform: str = Query("github"), us
                 "owner": owner,
                 "repo": repo,
                 "authors": authors_list,
-                "total_authors": len(authors_list),
+                "total_authors": len(authors_map),
                 "cached": False
             }
         }
@@ -124,6 +136,5 @@ async def get_authors(owner: str, repo: str, platform: str = Query("github"), us
         raise
     except Exception as e:
         print(f"✗ Failed to get authors: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Failed to get authors: {str(e)}")
@@ -1,6 +1,6 @@
 """Evaluation routes - author evaluation endpoints."""
 
-import json
+import traceback
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -14,11 +14,13 @@ from evaluator.schemas import EvaluationResponseSchema
 from evaluator.services import (
     resolve_plugin_id,
     get_evaluation_cache_path,
+    load_evaluation_cache,
+    save_evaluation_cache,
     get_plugins_snapshot,
     evaluate_author_incremental,
     get_repo_data_dir,
     fetch_gitee_commits,
-    merge_evaluations_logic,
+    merge_evaluations_logic_async,
 )
 
 router = APIRouter()
@@ -102,10 +104,9 @@ async def evaluate_author(
                 eval_path = get_evaluation_cache_path(eval_dir, alias, plugin_id, default_plugin_id)
                 previous_evaluation = None
 
-                if use_cache and eval_path.exists():
+                if use_cache:
                     try:
-                        with open(eval_path, 'r', encoding='utf-8') as f:
-                            previous_evaluation = json.load(f)
+                        previous_evaluation = load_evaluation_cache(eval_path)
                     except Exception as e:
                         print(f"[Aliases] ⚠ Failed to load cached evaluation: {e}")
 
@@ -141,9 +142,7 @@ async def evaluate_author(
 
                 # Save
                 if use_cache:
-                    eval_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(eval_path, 'w', encoding='utf-8') as f:
-                        json.dump(evaluation, f, indent=2, ensure_ascii=False)
+                    save_evaluation_cache(eval_path, evaluation)
 
                 alias_commits = [c for c in commits if any(a.lower() in str(c.get("author", "")).lower() for a in [alias])]
                 evaluations_to_merge.append({
@@ -154,7 +153,7 @@ async def evaluate_author(
 
             # Merge
             if len(evaluations_to_merge) >= 2:
-                merged_eval = merge_evaluations_logic(evaluations_to_merge, model)
+                merged_eval = await merge_evaluations_logic_async(evaluations_to_merge, model)
                 return {
                     "success": True,
                     "evaluation": merged_eval,
@@ -181,10 +180,9 @@ async def evaluate_author(
         eval_path = get_evaluation_cache_path(eval_dir, author, plugin_id, default_plugin_id)
         previous_evaluation = None
 
-        if use_cache and eval_path.exists():
+        if use_cache:
             try:
-                with open(eval_path, 'r', encoding='utf-8') as f:
-                    previous_evaluation = json.load(f)
+                previous_evaluation = load_evaluation_cache(eval_path)
             except Exception as e:
                 print(f"[Evaluation] ⚠ Failed to load previous evaluation: {e}")
 
@@ -220,9 +218,7 @@ async def evaluate_author(
 
         # Save
         if use_cache:
-            eval_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(eval_path, 'w', encoding='utf-8') as f:
-                json.dump(evaluation, f, indent=2, ensure_ascii=False)
+            save_evaluation_cache(eval_path, evaluation)
 
         return {
             "success": True,
@@ -234,7 +230,6 @@ async def evaluate_author(
         raise
     except Exception as e:
         print(f"✗ Evaluation failed: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
 
@@ -245,7 +240,7 @@ async def merge_evaluations(request: dict):
     evaluations_data = request.get("evaluations", [])
     model = request.get("model", DEFAULT_LLM_MODEL)
 
-    merged_evaluation = merge_evaluations_logic(evaluations_data, model)
+    merged_evaluation = await merge_evaluations_logic_async(evaluations_data, model)
 
     return {
         "success": True,
@@ -322,6 +317,5 @@ async def evaluate_gitee_contributor(
         raise
     except Exception as e:
         print(f"✗ Evaluation failed: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from evaluator.services import get_plugins_snapshot
+from evaluator.services import get_plugins_snapshot, resolve_plugin_id
 
 router = APIRouter()
 
@@ -13,6 +13,8 @@ async def list_plugins():
     List available scan plugins discovered from the local `plugins/` directory.
     """
     plugins, default_id = get_plugins_snapshot()
+    # Listing re-discovers plugins, so drop memoized resolutions as well.
+    resolve_plugin_id.cache_clear()
     print(f"[Info] Discovered {len(plugins)} plugins, default={default_id}")
     return {
         "success": True,
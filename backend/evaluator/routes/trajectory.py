@@ -1,24 +1,108 @@
 """Growth trajectory API endpoints."""
 
+import asyncio
+import json
+import logging
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 
 from evaluator.config import DEFAULT_LLM_MODEL, get_llm_api_key, get_github_token, get_gitee_token
-from evaluator.schemas import TrajectoryResponse
+from evaluator.schemas import (
+    TrajectoryResponse,
+    GetTrajectoryResponse,
+    ClearTrajectoryResponse,
+    CommitsByDateResponse,
+)
 from evaluator.services import (
     load_trajectory_cache,
+    invalidate_trajectory_cache,
     analyze_growth_trajectory,
+    get_latest_author_commit_sha,
     resolve_plugin_id,
-    get_commits_by_date
+    count_commits_by_date_async,
+    clear_commits_by_date_cache,
+    clear_trajectory_checkpoints_log,
 )
 from evaluator.paths import get_trajectory_cache_path
 from evaluator.utils import parse_repo_url
 
 router = APIRouter()
+logger = logging.getLogger("evaluator.trajectory")
+
+# One lock per trajectory cache file, so concurrent analyses of the same user don't
+# race on the same checkpoints and cache writes
+_analysis_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _analysis_lock(username: str) -> asyncio.Lock:
+    """Return the lock for a user (or author group), keyed like the trajectory cache file."""
+    key = str(get_trajectory_cache_path(username))
+    lock = _analysis_locks.get(key)
+    if lock is None:
+        lock = _analysis_locks[key] = asyncio.Lock()
+    return lock
+
+
+def _json_response(model) -> Response:
+    """
+    Serialize an already-validated response model once with Pydantic.
 
+    The declared response_model still documents the route; returning a Response
+    skips FastAPI's re-validation of the (potentially large) trajectory. Every
+    route returns through here (or a stream), so the model's own prebuilt
+    serializer is the only one used per request.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _cached_response_if_current(username: str, repo_urls: List[str], aliases: List[str]) -> Optional[TrajectoryResponse]:
+    """
+    Return the cached trajectory when it already covers the author's newest local commit.
+
+    Works like a conditional GET: if the cache tracks the same repos and its last_synced_sha
+    is still the newest commit, re-running the analysis could not add a checkpoint.
+    """
+    cached = load_trajectory_cache(username)
+    if cached is None or not cached.last_synced_sha or cached.repo_urls != repo_urls:
+        return None
+    if get_latest_author_commit_sha(repo_urls, username, aliases) != cached.last_synced_sha:
+        return None
+
+    pending = len(cached.accumulation_state.accumulated_commits) if cached.accumulation_state else 0
+    return TrajectoryResponse(
+        success=True,
+        trajectory=cached,
+        new_checkpoint_created=False,
+        message=f"Trajectory is up to date ({cached.total_checkpoints} checkpoints, no new commits).",
+        commits_pending=pending
+    )
+
+
+def _stream_commits_by_date(commits_by_date: Counter, message: str, batch_size: int = 1000) -> Iterator[bytes]:
+    """
+    Encode a CommitsByDateResponse body incrementally, one batch of rows at a time.
 
-@router.post("/api/trajectory/analyze")
+    Rows are emitted in date order straight from the counter, so the full
+    {date, count} list and its serialized form never exist in memory at once.
+    """
+    yield b'{"success":true,"data":['
+    batch = []
+    first = True
+    for date, count in sorted(commits_by_date.items()):
+        batch.append(json.dumps({"date": date, "count": count}, separators=(",", ":")))
+        if len(batch) >= batch_size:
+            yield (("" if first else ",") + ",".join(batch)).encode("utf-8")
+            batch = []
+            first = False
+    if batch:
+        yield (("" if first else ",") + ",".join(batch)).encode("utf-8")
+    yield ('],"message":' + json.dumps(message) + '}').encode("utf-8")
+
+
+@router.post("/api/trajectory/analyze", response_model=TrajectoryResponse)
 async def analyze_trajectory(
     request_body: Dict[str, Any],
     plugin: str = Query(""),
@@ -27,7 +111,7 @@ async def analyze_trajectory(
     use_cache: bool = Query(True),
     parallel_chunking: bool = Query(True),
     max_parallel_workers: int = Query(3)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Analyze user growth trajectory.
 
@@ -75,28 +159,17 @@ async def analyze_trajectory(
         # Check platform token configuration before analysis
         github_token = get_github_token()
         gitee_token = get_gitee_token()
-        missing_platforms = []
-        
-        for repo_url in repo_urls:
-            parsed = parse_repo_url(repo_url)
-            if not parsed:
-                continue  # Skip invalid URLs, they'll be handled later
-            
-            platform, owner, repo = parsed
-            if platform == "github" and not github_token:
-                if "github" not in missing_platforms:
-                    missing_platforms.append("github")
-            elif platform == "gitee" and not gitee_token:
-                if "gitee" not in missing_platforms:
-                    missing_platforms.append("gitee")
-        
-        if missing_platforms:
-            missing_tokens = []
-            if "github" in missing_platforms:
-                missing_tokens.append("GitHub Token (GITHUB_TOKEN)")
-            if "gitee" in missing_platforms:
-                missing_tokens.append("Gitee Token (GITEE_TOKEN)")
-            
+        parsed_urls = [parse_repo_url(repo_url) for repo_url in repo_urls]
+        # Invalid URLs are skipped here, they'll be handled later
+        platforms = {parsed[0] for parsed in parsed_urls if parsed}
+
+        missing_tokens = []
+        if "github" in platforms and not github_token:
+            missing_tokens.append("GitHub Token (GITHUB_TOKEN)")
+        if "gitee" in platforms and not gitee_token:
+            missing_tokens.append("Gitee Token (GITEE_TOKEN)")
+
+        if missing_tokens:
             raise HTTPException(
                 status_code=400,
                 detail=f"Missing required platform tokens: {', '.join(missing_tokens)}. "
@@ -107,34 +180,44 @@ async def analyze_trajectory(
         # Resolve plugin ID
         plugin_id = resolve_plugin_id(plugin)
 
-        print(f"[Trajectory API] Analyzing trajectory for {username}")
-        print(f"[Trajectory API] Repos: {repo_urls}")
-        print(f"[Trajectory API] Aliases: {aliases}")
-
-        # Call trajectory analysis service
-        response = analyze_growth_trajectory(
-            username=username,
-            repo_urls=repo_urls,
-            aliases=aliases,
-            plugin_id=plugin_id,
-            model=model,
-            language=language,
-            use_cache=use_cache,
-            parallel_chunking=parallel_chunking,
-            max_parallel_workers=max_parallel_workers
-        )
+        logger.info("[Trajectory API] Analyzing trajectory for %s", username)
+        logger.info("[Trajectory API] Repos: %s", repo_urls)
+        logger.info("[Trajectory API] Aliases: %s", aliases)
+
+        async with _analysis_lock(username):
+            # Checked under the lock: a request that waited for a concurrent analysis
+            # of the same user picks up its fresh result instead of redoing it
+            if use_cache:
+                cached_response = await asyncio.to_thread(_cached_response_if_current, username, repo_urls, aliases)
+                if cached_response is not None:
+                    logger.info("[Trajectory API] Cache is current for %s, skipping analysis", username)
+                    return _json_response(cached_response)
+
+            # Call trajectory analysis service (blocking network + LLM work runs in a worker thread)
+            response = await asyncio.to_thread(
+                analyze_growth_trajectory,
+                username=username,
+                repo_urls=repo_urls,
+                aliases=aliases,
+                plugin_id=plugin_id,
+                model=model,
+                language=language,
+                use_cache=use_cache,
+                parallel_chunking=parallel_chunking,
+                max_parallel_workers=max_parallel_workers
+            )
 
-        return response.model_dump()
+        return _json_response(response)
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Trajectory API] Error: {e}")
+        logger.error("[Trajectory API] Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Trajectory analysis failed: {str(e)}")
 
 
-@router.get("/api/trajectory/{username}")
-async def get_trajectory(username: str) -> Dict[str, Any]:
+@router.get("/api/trajectory/{username}", response_model=GetTrajectoryResponse)
+async def get_trajectory(username: str):
     """
     Get cached trajectory data for a user.
 
@@ -146,28 +229,28 @@ async def get_trajectory(username: str) -> Dict[str, Any]:
     }
     """
     try:
-        trajectory = load_trajectory_cache(username)
+        trajectory = await asyncio.to_thread(load_trajectory_cache, username)
 
         if trajectory is None:
-            return {
-                "success": False,
-                "trajectory": None,
-                "message": f"No trajectory data found for {username}"
-            }
-
-        return {
-            "success": True,
-            "trajectory": trajectory.model_dump(),
-            "message": f"Found trajectory with {trajectory.total_checkpoints} checkpoints"
-        }
+            return _json_response(GetTrajectoryResponse(
+                success=False,
+                trajectory=None,
+                message=f"No trajectory data found for {username}"
+            ))
+
+        return _json_response(GetTrajectoryResponse(
+            success=True,
+            trajectory=trajectory,
+            message=f"Found trajectory with {trajectory.total_checkpoints} checkpoints"
+        ))
 
     except Exception as e:
-        print(f"[Trajectory API] Error loading trajectory: {e}")
+        logger.error("[Trajectory API] Error loading trajectory: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to load trajectory: {str(e)}")
 
 
-@router.delete("/api/trajectory/{username}")
-async def clear_trajectory(username: str) -> Dict[str, Any]:
+@router.delete("/api/trajectory/{username}", response_model=ClearTrajectoryResponse)
+async def clear_trajectory(username: str):
     """
     Clear trajectory cache for a user (for testing/reset).
 
@@ -180,29 +263,37 @@ async def clear_trajectory(username: str) -> Dict[str, Any]:
     try:
         cache_path = get_trajectory_cache_path(username)
 
-        if not cache_path.exists():
-            return {
-                "success": False,
-                "message": f"No trajectory cache found for {username}"
-            }
-
-        cache_path.unlink()
-
-        return {
-            "success": True,
-            "message": f"Trajectory cache cleared for {username}"
-        }
+        # Single unlink instead of exists() + unlink(): no second stat, no race if it vanishes
+        try:
+            cache_path.unlink()
+        except FileNotFoundError:
+            return _json_response(ClearTrajectoryResponse(
+                success=False,
+                message=f"No trajectory cache found for {username}"
+            ))
+        finally:
+            invalidate_trajectory_cache()
+
+        clear_trajectory_checkpoints_log(username)
+        clear_commits_by_date_cache(username)
+
+        return _json_response(ClearTrajectoryResponse(
+            success=True,
+            message=f"Trajectory cache cleared for {username}"
+        ))
 
     except Exception as e:
-        print(f"[Trajectory API] Error clearing trajectory: {e}")
+        logger.error("[Trajectory API] Error clearing trajectory: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to clear trajectory: {str(e)}")
 
 
-@router.get("/api/trajectory/{username}/commits-by-date")
-async def get_commits_by_date_endpoint(username: str) -> Dict[str, Any]:
+@router.get("/api/trajectory/{username}/commits-by-date", response_model=CommitsByDateResponse)
+async def get_commits_by_date_endpoint(username: str):
     """
     Get commits grouped by date for visualization.
 
+    The body is streamed in chunks since prolific users can have many thousands of days.
+
     Returns:
     {
         "success": bool,
@@ -212,36 +303,33 @@ async def get_commits_by_date_endpoint(username: str) -> Dict[str, Any]:
     """
     try:
         # Load trajectory to get repo_urls and aliases
-        trajectory = load_trajectory_cache(username)
+        trajectory = await asyncio.to_thread(load_trajectory_cache, username)
 
         if trajectory is None:
-            return {
-                "success": False,
-                "data": [],
-                "message": f"No trajectory data found for {username}. Please run trajectory analysis first."
-            }
+            return _json_response(CommitsByDateResponse(
+                success=False,
+                data=[],
+                message=f"No trajectory data found for {username}. Please run trajectory analysis first."
+            ))
 
         # Get aliases from latest checkpoint if available
-        aliases = [username]
-        if trajectory.checkpoints:
-            latest_checkpoint = trajectory.checkpoints[-1]
-            if latest_checkpoint.aliases_used:
-                aliases = latest_checkpoint.aliases_used
+        checkpoints = trajectory.checkpoints
+        aliases = (checkpoints[-1].aliases_used if checkpoints else None) or [username]
 
         # Get commits by date
-        commits_data = get_commits_by_date(
+        commits_by_date = await count_commits_by_date_async(
             username=username,
             repo_urls=trajectory.repo_urls,
-            aliases=aliases
+            aliases=aliases,
+            last_synced_sha=trajectory.last_synced_sha
         )
+        logger.info("[Trajectory API] Found %s days with commits for %s", len(commits_by_date), username)
 
-        return {
-            "success": True,
-            "data": commits_data,
-            "message": f"Found {len(commits_data)} days with commits"
-        }
+        return StreamingResponse(
+            _stream_commits_by_date(commits_by_date, f"Found {len(commits_by_date)} days with commits"),
+            media_type="application/json"
+        )
 
     except Exception as e:
-        print(f"[Trajectory API] Error getting commits by date: {e}")
+        logger.error("[Trajectory API] Error getting commits by date: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get commits by date: {str(e)}")
-
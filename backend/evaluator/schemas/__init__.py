@@ -13,6 +13,10 @@ from .trajectory import (
     TrajectoryCache,
     TrajectoryResponse,
     PeriodAccumulationState,
+    GetTrajectoryResponse,
+    ClearTrajectoryResponse,
+    CommitsByDateEntry,
+    CommitsByDateResponse,
 )
 
 __all__ = [
@@ -26,4 +30,8 @@ __all__ = [
     "TrajectoryCache",
     "TrajectoryResponse",
     "PeriodAccumulationState",
+    "GetTrajectoryResponse",
+    "ClearTrajectoryResponse",
+    "CommitsByDateEntry",
+    "CommitsByDateResponse",
 ]
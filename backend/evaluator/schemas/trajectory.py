@@ -59,3 +59,33 @@ class TrajectoryResponse(BaseModel):
     new_checkpoint_created: bool = Field(False, description="Whether a new checkpoint was created")
     message: str = Field(..., description="Human-readable message about the operation")
     commits_pending: Optional[int] = Field(None, description="Number of commits not yet forming a checkpoint")
+
+
+class GetTrajectoryResponse(BaseModel):
+    """API response for fetching a cached trajectory."""
+
+    success: bool = Field(..., description="Whether a cached trajectory was found")
+    trajectory: Optional[TrajectoryCache] = Field(None, description="Cached trajectory data")
+    message: str = Field(..., description="Human-readable message about the operation")
+
+
+class ClearTrajectoryResponse(BaseModel):
+    """API response for clearing a cached trajectory."""
+
+    success: bool = Field(..., description="Whether a cache file was removed")
+    message: str = Field(..., description="Human-readable message about the operation")
+
+
+class CommitsByDateEntry(BaseModel):
+    """Number of commits authored on a single day."""
+
+    date: str = Field(..., description="Day in YYYY-MM-DD format")
+    count: int = Field(..., ge=0, description="Number of commits on that day")
+
+
+class CommitsByDateResponse(BaseModel):
+    """API response for the commits-by-date visualization."""
+
+    success: bool = Field(..., description="Whether the operation succeeded")
+    data: List[CommitsByDateEntry] = Field(default_factory=list, description="Daily commit counts sorted by date")
+    message: str = Field(..., description="Human-readable message about the operation")
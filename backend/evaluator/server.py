@@ -3,21 +3,17 @@
 FastAPI Backend for Engineer Skill Evaluator
 """
 
+import logging
 import os
-import json
-import subprocess
 import sys
-import threading
-import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
-from datetime import datetime
-import requests
-from fastapi import FastAPI, HTTPException, Query, Request, Body
+from typing import Optional
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, Response, RedirectResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 from dotenv import load_dotenv
 
 # Add backend directory to Python path to allow 'evaluator' imports
@@ -25,23 +21,10 @@ _backend_dir = Path(__file__).resolve().parent.parent
 if str(_backend_dir) not in sys.path:
     sys.path.insert(0, str(_backend_dir))
 
-from evaluator.paths import ensure_dirs, get_data_dir, get_home_dir, get_platform_data_dir, get_platform_eval_dir
-from evaluator.plugin_registry import discover_plugins, get_default_plugin_id, load_scan_module, PluginLoadError
-from evaluator.config import (
-    get_github_token, get_gitee_token, get_llm_api_key, mask_secret, DEFAULT_LLM_MODEL,
-    get_user_env_path, parse_env_file, write_env_file, apply_env_to_process
-)
-from evaluator.utils import (
-    parse_repo_url, parse_github_url,
-    get_author_from_commit, is_commit_by_author,
-    load_commits_from_local
-)
-from evaluator.services import (
-    get_plugins_snapshot, resolve_plugin_id, get_evaluation_cache_path,
-    extract_github_data, extract_gitee_data, fetch_github_commits, fetch_gitee_commits, get_repo_data_dir,
-    get_or_create_evaluator, evaluate_author_incremental, get_empty_evaluation,
-    merge_evaluations_logic
-)
+# Only what the app shell itself uses; routers import their own dependencies.
+from evaluator.paths import ensure_dirs, get_data_dir
+from evaluator.config import get_user_env_path
+from evaluator.services import close_llm_client
 from evaluator.routes import plugins, config, data, evaluation, batch, benchmark, trajectory, external
 
 # Load environment variables
@@ -57,17 +40,41 @@ if user_env_path.exists():
     load_dotenv(str(user_env_path), override=False)
 load_dotenv(override=False)
 
-app = FastAPI(title="Engineer Skill Evaluator API")
+# Route modules log through `logging`; print bare messages like the rest of the server output.
+# Only the app's own "evaluator.*" loggers are set up; the root logger (httpx etc.) is left alone.
+_app_logger = logging.getLogger("evaluator")
+if not _app_logger.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(message)s"))
+    _app_logger.addHandler(_log_handler)
+_app_logger.setLevel(logging.INFO)
+_app_logger.propagate = False
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the pooled keep-alive connections of the shared LLM client
+    await close_llm_client()
+
+
+# Trailing slashes are normalized by the middleware below, so Starlette's redirect is never needed
+app = FastAPI(title="Engineer Skill Evaluator API", redirect_slashes=False, lifespan=lifespan)
 
 # Middleware to strip trailing slashes from API requests
 # (Next.js uses trailingSlash: true for static export, but FastAPI routes don't have trailing slashes)
-class TrailingSlashMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path != "/" and request.url.path.endswith("/"):
-            # Strip trailing slash and redirect internally
-            new_path = request.url.path.rstrip("/")
-            request.scope["path"] = new_path
-        return await call_next(request)
+# Plain ASGI rather than BaseHTTPMiddleware: no extra task/stream wrapping per request.
+class TrailingSlashMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path != "/" and path.endswith("/"):
+                # Strip trailing slash and rewrite internally
+                scope = dict(scope, path=path.rstrip("/") or "/")
+        await self.app(scope, receive, send)
 
 app.add_middleware(TrailingSlashMiddleware)
 
@@ -4,6 +4,8 @@ from evaluator.services.plugin_service import (
     get_plugins_snapshot,
     resolve_plugin_id,
     get_evaluation_cache_path,
+    load_evaluation_cache,
+    save_evaluation_cache,
 )
 from evaluator.services.extraction_service import (
     extract_github_data,
@@ -17,18 +19,34 @@ from evaluator.services.evaluation_service import (
     evaluate_author_incremental,
     get_empty_evaluation,
 )
-from evaluator.services.merge_service import merge_evaluations_logic
+from evaluator.services.http_session import get_llm_timeout, post_llm_request, close_llm_client
+from evaluator.services.llm_cache import (
+    llm_cache_key,
+    get_cached_llm_response,
+    get_cached_llm_response_async,
+    cache_llm_response,
+    cache_llm_response_async,
+)
+from evaluator.services.merge_service import merge_evaluations_logic_async
 from evaluator.services.trajectory_service import (
     load_trajectory_cache,
     save_trajectory_cache,
+    invalidate_trajectory_cache,
     analyze_growth_trajectory,
+    get_latest_author_commit_sha,
     get_commits_by_date,
+    get_commits_by_date_async,
+    count_commits_by_date_async,
+    clear_commits_by_date_cache,
+    clear_trajectory_checkpoints_log,
 )
 
 __all__ = [
     "get_plugins_snapshot",
     "resolve_plugin_id",
     "get_evaluation_cache_path",
+    "load_evaluation_cache",
+    "save_evaluation_cache",
     "extract_github_data",
     "extract_gitee_data",
     "fetch_github_commits",
@@ -37,9 +55,23 @@ __all__ = [
     "get_or_create_evaluator",
     "evaluate_author_incremental",
     "get_empty_evaluation",
-    "merge_evaluations_logic",
+    "get_llm_timeout",
+    "post_llm_request",
+    "close_llm_client",
+    "llm_cache_key",
+    "get_cached_llm_response",
+    "get_cached_llm_response_async",
+    "cache_llm_response",
+    "cache_llm_response_async",
+    "merge_evaluations_logic_async",
     "load_trajectory_cache",
     "save_trajectory_cache",
+    "invalidate_trajectory_cache",
     "analyze_growth_trajectory",
+    "get_latest_author_commit_sha",
     "get_commits_by_date",
+    "get_commits_by_date_async",
+    "count_commits_by_date_async",
+    "clear_commits_by_date_cache",
+    "clear_trajectory_checkpoints_log",
 ]
@@ -10,7 +10,7 @@ from fastapi import HTTPException
 
 from evaluator.config import get_llm_api_key, DEFAULT_LLM_MODEL
 from evaluator.plugin_registry import load_scan_module
-from evaluator.utils import is_commit_by_author
+from evaluator.utils import is_commit_by_author, is_commit_by_any_author
 from evaluator.services.plugin_service import resolve_plugin_id
 from evaluator.services.extraction_service import get_repo_data_dir
 
@@ -102,10 +102,8 @@ def evaluate_author_incremental(
     """
     # Filter commits by author (including aliases)
     if aliases:
-        author_commits = [
-            c for c in commits
-            if any(is_commit_by_author(c, alias) for alias in aliases)
-        ]
+        alias_set = frozenset(alias.lower() for alias in aliases)
+        author_commits = [c for c in commits if is_commit_by_any_author(c, alias_set)]
         print(f"[Incremental] Filtering commits by {len(aliases)} aliases: {aliases}")
     else:
         author_commits = [c for c in commits if is_commit_by_author(c, author)]
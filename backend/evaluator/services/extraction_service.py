@@ -5,6 +5,7 @@ import subprocess
 import json
 import os
 import socket
+import traceback
 import requests
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
@@ -105,7 +106,6 @@ def extract_github_data(owner: str, repo: str) -> bool:
         return False
     except Exception as e:
         print(f"✗ Extraction error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
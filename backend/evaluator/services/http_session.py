@@ -0,0 +1,118 @@
+"""Shared async HTTP client, retries and timeouts for outbound LLM calls."""
+
+import asyncio
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+# Request timeouts (seconds) selectable via LLM_TIMEOUT_PROFILE; slow local models need longer
+LLM_TIMEOUT_PROFILES = {
+    "default": 60,
+    "ml_inference": 300,
+    "batch": 600,
+}
+
+# Retry transient failures and rate limits; LLM completions are safe to resend
+LLM_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+LLM_MAX_RETRIES = 3
+LLM_RETRY_BACKOFF = 0.5
+# Upper bound on a server-requested Retry-After wait (seconds)
+LLM_MAX_RETRY_AFTER = 30.0
+
+# One AsyncClient (connection pool + keep-alive) and concurrency limit per event loop
+_async_client: Optional[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient, asyncio.Semaphore]] = None
+
+
+def get_llm_timeout() -> int:
+    """Timeout for LLM requests from LLM_TIMEOUT_PROFILE (falls back to "default")."""
+    profile = os.getenv("LLM_TIMEOUT_PROFILE", "default").strip().lower()
+    return LLM_TIMEOUT_PROFILES.get(profile, LLM_TIMEOUT_PROFILES["default"])
+
+
+def get_llm_concurrency() -> int:
+    """Max in-flight async LLM requests per process (LLM_CONCURRENCY, default 16)."""
+    try:
+        return max(1, int(os.getenv("LLM_CONCURRENCY", "16")))
+    except ValueError:
+        return 16
+
+
+def _close_stale_client(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    """Release a replaced client's pooled connections on the loop that owns them, if it is still open."""
+    if client.is_closed or loop.is_closed():
+        return
+    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+def _get_async_client() -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """Return the shared AsyncClient and semaphore, creating them for the running loop if needed."""
+    global _async_client
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client[0] is not loop or _async_client[1].is_closed:
+        if _async_client is not None:
+            _close_stale_client(*_async_client[:2])
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+        client = httpx.AsyncClient(
+            # Fail fast on connect/pool waits; reads cover slow completions
+            timeout=httpx.Timeout(get_llm_timeout(), connect=5.0, pool=5.0),
+            limits=limits,
+            # httpx only retries failed connects; status-based retries happen in post_llm_request
+            transport=httpx.AsyncHTTPTransport(retries=3, limits=limits),
+        )
+        _async_client = (loop, client, asyncio.Semaphore(get_llm_concurrency()))
+    return _async_client[1], _async_client[2]
+
+
+async def close_llm_client() -> None:
+    """Close the shared AsyncClient if it belongs to the running loop (call on app shutdown)."""
+    global _async_client
+    if _async_client is not None and _async_client[0] is asyncio.get_running_loop():
+        client = _async_client[1]
+        _async_client = None
+        await client.aclose()
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: the numeric Retry-After if given, else exponential backoff."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(max(0.0, float(retry_after)), LLM_MAX_RETRY_AFTER)
+        except ValueError:
+            pass
+    return LLM_RETRY_BACKOFF * (2 ** attempt)
+
+
+async def post_llm_request(url: str, api_key: str, body: Dict[str, Any]) -> httpx.Response:
+    """
+    POST an LLM request through the shared async client.
+
+    At most LLM_CONCURRENCY requests are in flight at once across all callers.
+    Rate limits (429) and transient 5xx responses are retried up to LLM_MAX_RETRIES
+    times, honoring Retry-After and otherwise backing off exponentially.
+
+    Args:
+        url: Chat completions endpoint
+        api_key: Bearer token
+        body: JSON request body
+
+    Returns:
+        The httpx response (status is not checked)
+    """
+    client, semaphore = _get_async_client()
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+    attempt = 0
+    while True:
+        async with semaphore:
+            response = await client.post(url, headers=headers, json=body)
+        if response.status_code not in LLM_RETRY_STATUSES or attempt >= LLM_MAX_RETRIES:
+            return response
+        # Wait outside the semaphore so backing-off requests don't hold a slot
+        delay = _retry_delay(response, attempt)
+        print(f"[LLM] HTTP {response.status_code}, retrying in {delay:.1f}s ({attempt + 1}/{LLM_MAX_RETRIES})")
+        await asyncio.sleep(delay)
+        attempt += 1
@@ -0,0 +1,132 @@
+"""Persistent response cache for deterministic LLM prompts."""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from evaluator.paths import get_trajectory_cache_dir
+
+DEFAULT_LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600
+# The file is append-only; rewrite it on load once expired, superseded or corrupt
+# lines make up at least this fraction of it
+COMPACT_STALE_FRACTION = 0.5
+
+# key -> (expires_at, text); mirrors the JSONL file at _loaded_path
+_entries: Dict[str, Tuple[float, str]] = {}
+_loaded_path: Optional[Path] = None
+_lock = threading.Lock()
+
+
+def get_llm_cache_path() -> Path:
+    """Cache file lives next to the trajectory caches (home/track/llm_cache.jsonl)."""
+    return get_trajectory_cache_dir() / "llm_cache.jsonl"
+
+
+def llm_cache_key(model: str, prompt: str) -> str:
+    """Stable key for a (model, prompt) pair."""
+    payload = json.dumps({"m": model, "p": prompt}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _compact(path: Path) -> None:
+    """Rewrite the JSONL file with only the live in-memory entries (atomic replace)."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, (expires_at, text) in _entries.items():
+                f.write(json.dumps({"key": key, "expires_at": expires_at, "text": text}, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"[LLM Cache] Failed to compact {path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _ensure_loaded(path: Path) -> None:
+    """Load the JSONL file into memory once per cache path (later lines win), compacting it if mostly stale."""
+    global _loaded_path
+    if _loaded_path == path:
+        return
+
+    _entries.clear()
+    total_lines = 0
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                total_lines += 1
+                try:
+                    entry = json.loads(line)
+                    _entries[entry["key"]] = (float(entry["expires_at"]), entry["text"])
+                except (ValueError, KeyError, TypeError):
+                    continue  # skip truncated/corrupt lines
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[LLM Cache] Failed to load {path}: {e}")
+    else:
+        now = time.time()
+        for key in [key for key, (expires_at, _) in _entries.items() if expires_at < now]:
+            del _entries[key]
+        stale_lines = total_lines - len(_entries)
+        if stale_lines and stale_lines >= total_lines * COMPACT_STALE_FRACTION:
+            print(f"[LLM Cache] Compacting {path}: dropping {stale_lines} of {total_lines} lines")
+            _compact(path)
+    _loaded_path = path
+
+
+def get_cached_llm_response(key: str) -> Optional[str]:
+    """
+    Look up a cached LLM response.
+
+    Args:
+        key: Key from llm_cache_key()
+
+    Returns:
+        Cached response text, or None if missing or expired
+    """
+    with _lock:
+        _ensure_loaded(get_llm_cache_path())
+        entry = _entries.get(key)
+        if entry is None:
+            return None
+        expires_at, text = entry
+        if expires_at < time.time():
+            del _entries[key]
+            return None
+        return text
+
+
+def cache_llm_response(key: str, text: str, ttl: float = DEFAULT_LLM_CACHE_TTL_SECONDS) -> None:
+    """
+    Store an LLM response in memory and append it to the JSONL cache file.
+
+    Args:
+        key: Key from llm_cache_key()
+        text: Response text to cache
+        ttl: Time to live in seconds
+    """
+    expires_at = time.time() + ttl
+    with _lock:
+        path = get_llm_cache_path()
+        _ensure_loaded(path)
+        _entries[key] = (expires_at, text)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key, "expires_at": expires_at, "text": text}, ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f"[LLM Cache] Failed to persist entry: {e}")
+
+
+async def get_cached_llm_response_async(key: str) -> Optional[str]:
+    """get_cached_llm_response() with the (first-call) file load off the event loop."""
+    return await asyncio.to_thread(get_cached_llm_response, key)
+
+
+async def cache_llm_response_async(key: str, text: str, ttl: float = DEFAULT_LLM_CACHE_TTL_SECONDS) -> None:
+    """cache_llm_response() with the file append off the event loop."""
+    await asyncio.to_thread(cache_llm_response, key, text, ttl)
@@ -1,94 +1,105 @@
 """Multi-evaluation merging service."""
 
-import requests
-from typing import Dict, Any, List
+import traceback
+from typing import Dict, Any, List, Optional
 from fastapi import HTTPException
 
 from evaluator.config import get_llm_api_key, DEFAULT_LLM_MODEL
+from evaluator.services.http_session import post_llm_request
+from evaluator.services.llm_cache import llm_cache_key, get_cached_llm_response_async, cache_llm_response_async
 
+OPENROUTER_CHAT_URL = "https://openrouter.ai/api/v1/chat/completions"
 
-def merge_evaluations_logic(evaluations_data: List[Dict[str, Any]], model: str = DEFAULT_LLM_MODEL) -> Dict[str, Any]:
-    """
-    Merge multiple evaluations into one using LLM-based weighted combination.
+DIMENSION_KEYS = ('ai_fullstack', 'ai_architecture', 'cloud_native', 'open_source', 'intelligent_dev', 'leadership')
 
-    Args:
-        evaluations_data: List of evaluation items with author, weight, and evaluation
-        model: LLM model to use for merging summaries
 
-    Returns:
-        Merged evaluation dictionary
+def _score_value(value: Any) -> Any:
+    """Handle both numeric and string scores (unparseable strings count as 0)."""
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return 0
+    return value
+
+
+def _llm_request_body(model: str, merge_prompt: str) -> Dict[str, Any]:
+    return {
+        "model": model,
+        "messages": [
+            {"role": "user", "content": merge_prompt}
+        ],
+        "temperature": 0.3,
+        "max_tokens": 1500
+    }
+
+
+def _prepare_merge(evaluations_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compute everything that doesn't need the LLM: weighted scores, merged commit
+    summary and the merge prompt.
 
     Raises:
-        HTTPException: If validation fails or merging errors occur
+        HTTPException: If validation fails
     """
     if not evaluations_data or len(evaluations_data) < 2:
         raise HTTPException(status_code=400, detail="At least 2 evaluations required for merging")
 
-    try:
-        # Extract evaluations and weights
-        evaluations = []
-        weights = []
-        authors = []
-
-        for item in evaluations_data:
-            author = item.get("author", "Unknown")
-            weight = item.get("weight", 0)
-            evaluation = item.get("evaluation", {})
-
-            authors.append(author)
-            weights.append(weight)
-            evaluations.append(evaluation)
-
-        total_weight = sum(weights)
-        if total_weight == 0:
-            raise HTTPException(status_code=400, detail="Total weight cannot be zero")
-
-        print(f"[Merge] Merging {len(evaluations)} evaluations with weights: {weights}")
-
-        # Step 1: Calculate weighted average scores
-        merged_scores = {}
-        dimension_keys = ['ai_fullstack', 'ai_architecture', 'cloud_native', 'open_source', 'intelligent_dev', 'leadership']
-
-        for key in dimension_keys:
-            weighted_sum = 0
-            for eval_data, weight in zip(evaluations, weights):
-                scores = eval_data.get("scores", {})
-                score_value = scores.get(key, 0)
-                # Handle both numeric and string scores
-                if isinstance(score_value, str):
-                    try:
-                        score_value = float(score_value)
-                    except:
-                        score_value = 0
-                weighted_sum += score_value * weight
-
-            merged_scores[key] = round(weighted_sum / total_weight, 1)
-
-        # Step 2: Merge commit summaries
-        total_commits = sum(eval_data.get("total_commits_analyzed", 0) for eval_data in evaluations)
-
-        merged_commits_summary = {
-            "total_additions": sum(eval_data.get("commits_summary", {}).get("total_additions", 0) for eval_data in evaluations),
-            "total_deletions": sum(eval_data.get("commits_summary", {}).get("total_deletions", 0) for eval_data in evaluations),
-            "files_changed": sum(eval_data.get("commits_summary", {}).get("files_changed", 0) for eval_data in evaluations),
-            "languages": list(set(
-                lang
-                for eval_data in evaluations
-                for lang in eval_data.get("commits_summary", {}).get("languages", [])
-            ))
-        }
-
-        # Step 3: Use LLM to merge reasoning/analysis summaries
-        print(f"[Merge] Using LLM to merge analysis summaries...")
-
-        # Build prompt for LLM
-        summaries_text = ""
-        for author, weight, eval_data in zip(authors, weights, evaluations):
-            reasoning = eval_data.get("scores", {}).get("reasoning", "")
-            percentage = round((weight / total_weight) * 100, 1)
-            summaries_text += f"\n### {author} ({weight} commits, {percentage}% weight):\n{reasoning}\n"
-
-        merge_prompt = f"""You are analyzing a software engineer who uses multiple names/identities in their commits. You have separate evaluations for each identity, and you need to create a unified, comprehensive analysis.
+    # Extract evaluations and weights
+    evaluations = []
+    weights = []
+    authors = []
+
+    for item in evaluations_data:
+        author = item.get("author", "Unknown")
+        weight = item.get("weight", 0)
+        evaluation = item.get("evaluation", {})
+
+        authors.append(author)
+        weights.append(weight)
+        evaluations.append(evaluation)
+
+    total_weight = sum(weights)
+    if total_weight == 0:
+        raise HTTPException(status_code=400, detail="Total weight cannot be zero")
+
+    print(f"[Merge] Merging {len(evaluations)} evaluations with weights: {weights}")
+
+    # Step 1: Calculate weighted average scores (one pass over evaluations)
+    weighted_sums = dict.fromkeys(DIMENSION_KEYS, 0)
+    for eval_data, weight in zip(evaluations, weights):
+        scores = eval_data.get("scores", {})
+        for key in DIMENSION_KEYS:
+            weighted_sums[key] += _score_value(scores.get(key, 0)) * weight
+
+    merged_scores = {key: round(weighted_sums[key] / total_weight, 1) for key in DIMENSION_KEYS}
+
+    # Step 2: Merge commit summaries (one pass for all totals)
+    total_commits = total_additions = total_deletions = files_changed = 0
+    languages = set()
+    for eval_data in evaluations:
+        total_commits += eval_data.get("total_commits_analyzed", 0)
+        commits_summary = eval_data.get("commits_summary") or {}
+        total_additions += commits_summary.get("total_additions", 0)
+        total_deletions += commits_summary.get("total_deletions", 0)
+        files_changed += commits_summary.get("files_changed", 0)
+        languages.update(commits_summary.get("languages") or ())
+
+    merged_commits_summary = {
+        "total_additions": total_additions,
+        "total_deletions": total_deletions,
+        "files_changed": files_changed,
+        "languages": list(languages)
+    }
+
+    # Step 3: Build prompt for LLM to merge reasoning/analysis summaries
+    summaries_text = "".join(
+        f"\n### {author} ({weight} commits, {round((weight / total_weight) * 100, 1)}% weight):\n"
+        f"{eval_data.get('scores', {}).get('reasoning', '')}\n"
+        for author, weight, eval_data in zip(authors, weights, evaluations)
+    )
+
+    merge_prompt = f"""You are analyzing a software engineer who uses multiple names/identities in their commits. You have separate evaluations for each identity, and you need to create a unified, comprehensive analysis.
 
 Below are the individual analyses with their weights (based on commit count):
 
@@ -112,65 +123,117 @@ Create a unified analysis that:
 
 Write the unified analysis (3-5 paragraphs):"""
 
+    return {
+        "evaluations": evaluations,
+        "weights": weights,
+        "authors": authors,
+        "merged_scores": merged_scores,
+        "total_commits": total_commits,
+        "merged_commits_summary": merged_commits_summary,
+        "summaries_text": summaries_text,
+        "merge_prompt": merge_prompt,
+    }
+
+
+def _fallback_reasoning(prepared: Dict[str, Any]) -> str:
+    return f"Combined analysis from {len(prepared['authors'])} identities:\n\n" + prepared["summaries_text"]
+
+
+def _no_key_reasoning(prepared: Dict[str, Any]) -> str:
+    # Fallback: simple concatenation
+    authors = prepared["authors"]
+    return f"Combined analysis from {len(authors)} identities ({', '.join(authors)}):\n\n" + prepared["summaries_text"]
+
+
+async def _reasoning_from_response(
+    ok: bool,
+    response_data: Optional[Dict[str, Any]],
+    prepared: Dict[str, Any],
+    cache_key: str
+) -> str:
+    if ok:
+        merged_reasoning = response_data["choices"][0]["message"]["content"]
+        print(f"[Merge] ✓ LLM successfully merged summaries ({len(merged_reasoning)} chars)")
+        # The prompt is fully determined by the inputs, so the same merge can be reused
+        await cache_llm_response_async(cache_key, merged_reasoning)
+        return merged_reasoning
+    print(f"[Merge] ⚠ LLM request failed, using concatenation fallback")
+    return _fallback_reasoning(prepared)
+
+
+def _finalize_merge(prepared: Dict[str, Any], merged_reasoning: str) -> Dict[str, Any]:
+    evaluations = prepared["evaluations"]
+    authors = prepared["authors"]
+
+    # Add merged reasoning to scores
+    merged_scores = prepared["merged_scores"]
+    merged_scores["reasoning"] = merged_reasoning
+
+    # Build final merged evaluation
+    return {
+        "username": " + ".join(authors),
+        "mode": "merged",
+        "total_commits_analyzed": prepared["total_commits"],
+        "merged_from": len(evaluations),
+        "authors": authors,
+        "weights": prepared["weights"],
+        "scores": merged_scores,
+        "commits_summary": prepared["merged_commits_summary"],
+        "files_loaded": sum(eval_data.get("files_loaded", 0) for eval_data in evaluations)
+    }
+
+
+def _merge_failed(e: Exception) -> HTTPException:
+    print(f"✗ Merge failed: {e}")
+    traceback.print_exc()
+    return HTTPException(status_code=500, detail=f"Merge failed: {str(e)}")
+
+
+async def merge_evaluations_logic_async(evaluations_data: List[Dict[str, Any]], model: str = DEFAULT_LLM_MODEL) -> Dict[str, Any]:
+    """
+    Merge multiple evaluations into one using LLM-based weighted combination.
+
+    The LLM call goes through the shared httpx.AsyncClient (pooled keep-alive
+    connections, bounded concurrency), so it never blocks the event loop.
+
+    Args:
+        evaluations_data: List of evaluation items with author, weight, and evaluation
+        model: LLM model to use for merging summaries
+
+    Returns:
+        Merged evaluation dictionary
+
+    Raises:
+        HTTPException: If validation fails or merging errors occur
+    """
+    try:
+        prepared = _prepare_merge(evaluations_data)
+
         # Call LLM to merge summaries
+        print(f"[Merge] Using LLM to merge analysis summaries...")
         api_key = get_llm_api_key()
+        cache_key = llm_cache_key(model, prepared["merge_prompt"])
+        cached_reasoning = await get_cached_llm_response_async(cache_key) if api_key else None
         if not api_key:
-            # Fallback: simple concatenation
-            merged_reasoning = f"Combined analysis from {len(authors)} identities ({', '.join(authors)}):\n\n"
-            merged_reasoning += summaries_text
+            merged_reasoning = _no_key_reasoning(prepared)
+        elif cached_reasoning is not None:
+            print(f"[Merge] ✓ Using cached merged summary")
+            merged_reasoning = cached_reasoning
         else:
             try:
-                llm_response = requests.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": model,
-                        "messages": [
-                            {"role": "user", "content": merge_prompt}
-                        ],
-                        "temperature": 0.3,
-                        "max_tokens": 1500
-                    },
-                    timeout=60
+                llm_response = await post_llm_request(
+                    OPENROUTER_CHAT_URL, api_key, _llm_request_body(model, prepared["merge_prompt"])
+                )
+                merged_reasoning = await _reasoning_from_response(
+                    llm_response.is_success, llm_response.json() if llm_response.is_success else None, prepared, cache_key
                 )
-
-                if llm_response.ok:
-                    response_data = llm_response.json()
-                    merged_reasoning = response_data["choices"][0]["message"]["content"]
-                    print(f"[Merge] ✓ LLM successfully merged summaries ({len(merged_reasoning)} chars)")
-                else:
-                    print(f"[Merge] ⚠ LLM request failed, using concatenation fallback")
-                    merged_reasoning = f"Combined analysis from {len(authors)} identities:\n\n" + summaries_text
-
             except Exception as e:
                 print(f"[Merge] ⚠ LLM merge failed: {e}, using concatenation fallback")
-                merged_reasoning = f"Combined analysis from {len(authors)} identities:\n\n" + summaries_text
-
-        # Add merged reasoning to scores
-        merged_scores["reasoning"] = merged_reasoning
-
-        # Build final merged evaluation
-        merged_evaluation = {
-            "username": " + ".join(authors),
-            "mode": "merged",
-            "total_commits_analyzed": total_commits,
-            "merged_from": len(evaluations),
-            "authors": authors,
-            "weights": weights,
-            "scores": merged_scores,
-            "commits_summary": merged_commits_summary,
-            "files_loaded": sum(eval_data.get("files_loaded", 0) for eval_data in evaluations)
-        }
-
-        return merged_evaluation
+                merged_reasoning = _fallback_reasoning(prepared)
+
+        return _finalize_merge(prepared, merged_reasoning)
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"✗ Merge failed: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Merge failed: {str(e)}")
+        raise _merge_failed(e)
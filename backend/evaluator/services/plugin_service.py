@@ -1,7 +1,9 @@
 """Plugin discovery and management service."""
 
+import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 from fastapi import HTTPException
 
 from evaluator.plugin_registry import discover_plugins, get_default_plugin_id
@@ -14,10 +16,14 @@ def get_plugins_snapshot():
     return plugins, default_id
 
 
+@lru_cache(maxsize=32)
 def resolve_plugin_id(requested: Optional[str]) -> str:
     """
     Resolve and validate plugin ID.
 
+    Successful resolutions are memoized per process (errors are not cached);
+    `resolve_plugin_id.cache_clear()` forces re-discovery.
+
     Args:
         requested: Requested plugin ID (or None for default)
 
@@ -68,3 +74,39 @@ def get_evaluation_cache_path(eval_dir: Path, author: str, plugin_id: str, defau
     if plugin_id in ("", "builtin"):
         return eval_dir / f"{safe_author}.json"
     return eval_dir / f"{safe_author}__{plugin_id}.json"
+
+
+def load_evaluation_cache(eval_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached evaluation result.
+
+    Args:
+        eval_path: Path from get_evaluation_cache_path()
+
+    Returns:
+        Cached evaluation dict, or None if there is no cache file
+
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    # Bytes straight into json.loads, no text-layer decode; no exists() pre-check
+    try:
+        with open(eval_path, 'rb') as f:
+            return json.loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def save_evaluation_cache(eval_path: Path, evaluation: Dict[str, Any]) -> None:
+    """
+    Write an evaluation result to its cache file.
+
+    Args:
+        eval_path: Path from get_evaluation_cache_path()
+        evaluation: Evaluation dict to cache
+    """
+    # Encode in one json.dumps call and write once (json.dump issues a write per token)
+    data = json.dumps(evaluation, indent=2, ensure_ascii=False).encode('utf-8')
+    eval_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(eval_path, 'wb') as f:
+        f.write(data)
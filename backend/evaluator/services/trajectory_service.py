@@ -1,11 +1,24 @@
 """Trajectory service for managing user growth tracking."""
 
+import asyncio
+import hashlib
 import json
+import logging
+import os
+import re
+import sys
+import traceback
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from types import ModuleType
+from typing import Callable, Dict, Any, FrozenSet, List, Optional, Tuple
 from datetime import datetime, timedelta
 
-from evaluator.paths import get_trajectory_cache_path, get_platform_data_dir
+from evaluator.paths import get_trajectory_cache_path, get_commits_by_date_cache_path, get_platform_data_dir
 from evaluator.config import get_llm_api_key
 from evaluator.schemas import (
     TrajectoryCache,
@@ -15,10 +28,19 @@ from evaluator.schemas import (
     EvaluationSchema,
     PeriodAccumulationState,
 )
-from evaluator.utils import load_commits_from_local, is_commit_by_author
+from evaluator.utils import (
+    load_commits_from_local,
+    iter_commits_from_local,
+    load_commits_list_cached,
+    is_commit_by_any_author,
+    iter_json_array,
+)
 from evaluator.services.evaluation_service import get_or_create_evaluator
 from evaluator.services.extraction_service import extract_github_data, extract_gitee_data
-from evaluator.plugin_registry import load_scan_module
+from evaluator.plugin_registry import load_scan_module, PluginMeta
+
+# Verbose checkpoint diagnostics; enable with logging level DEBUG
+logger = logging.getLogger("evaluator.trajectory")
 
 
 def load_trajectory_cache(username: str) -> Optional[TrajectoryCache]:
@@ -30,7 +52,8 @@ def load_trajectory_cache(username: str) -> Optional[TrajectoryCache]:
                  If comma-separated, authors will be sorted alphabetically for consistent caching.
 
     Returns:
-        TrajectoryCache if exists, None otherwise
+        TrajectoryCache if exists, None otherwise.
+        The instance is shared with the in-memory cache: copy it before mutating.
     """
     # Normalize username (sort if comma-separated)
     if ',' in username:
@@ -39,35 +62,122 @@ def load_trajectory_cache(username: str) -> Optional[TrajectoryCache]:
 
     cache_path = get_trajectory_cache_path(username)
 
-    if not cache_path.exists():
+    try:
+        stat = cache_path.stat()
+    except FileNotFoundError:
         return None
 
     try:
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return TrajectoryCache(**data)
+        log_stat = _checkpoints_log_path(cache_path).stat()
+        log_key = (log_stat.st_mtime_ns, log_stat.st_size)
+    except FileNotFoundError:
+        log_key = None
+
+    try:
+        return _load_trajectory_cached(str(cache_path), stat.st_mtime_ns, stat.st_size, log_key)
     except Exception as e:
         print(f"[Trajectory] Failed to load cache for {username}: {e}")
         return None
 
 
-def save_trajectory_cache(trajectory: TrajectoryCache) -> None:
+@lru_cache(maxsize=512)
+def _load_trajectory_cached(
+    cache_path: str,
+    mtime_ns: int,
+    size: int,
+    log_key: Optional[Tuple[int, int]]
+) -> TrajectoryCache:
+    """
+    Parse a trajectory cache file plus its checkpoint log, if any; keyed by both files'
+    stat so rewritten or appended files are re-read.
+    """
+    _ = (mtime_ns, size)
+    with open(cache_path, 'rb') as f:
+        trajectory = TrajectoryCache.model_validate_json(f.read())
+
+    if log_key is not None:
+        # Header first, then the log (later entries win). The header is written last on
+        # save, so checkpoints beyond its total_checkpoints are from an interrupted save.
+        checkpoints = {cp.checkpoint_id: cp for cp in trajectory.checkpoints}
+        for cp in _read_checkpoints_log(_checkpoints_log_path(Path(cache_path))):
+            if cp.checkpoint_id <= trajectory.total_checkpoints:
+                checkpoints[cp.checkpoint_id] = cp
+        trajectory.checkpoints = list(checkpoints.values())
+
+    return trajectory
+
+
+def _checkpoints_log_path(cache_path: Path) -> Path:
+    """Append-only checkpoint log next to the trajectory cache ({name}.checkpoints.jsonl)."""
+    return cache_path.with_suffix('.checkpoints.jsonl')
+
+
+def _read_checkpoints_log(log_path: Path) -> List[TrajectoryCheckpoint]:
+    checkpoints = []
+    with open(log_path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                checkpoints.append(TrajectoryCheckpoint.model_validate_json(line))
+            except ValueError as e:
+                # A torn final line from an interrupted append; its header was never written
+                print(f"[Trajectory] Skipping unreadable checkpoint in {log_path.name}: {e}")
+    return checkpoints
+
+
+def invalidate_trajectory_cache() -> None:
+    """Drop in-memory parsed trajectory caches (call after deleting or rewriting cache files)."""
+    _load_trajectory_cached.cache_clear()
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry update to disk (no-op where directories can't be opened)."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def save_trajectory_cache(trajectory: TrajectoryCache, persisted_checkpoints: Optional[int] = None) -> None:
     """
-    Save trajectory cache to disk with atomic write.
+    Save trajectory cache to disk with an atomic, durable write (write temp file,
+    fsync it, os.replace over the cache, fsync the directory).
+
+    With persisted_checkpoints (how many of trajectory.checkpoints were loaded from
+    disk), only the new checkpoints are appended to the {name}.checkpoints.jsonl log
+    and the small header is rewritten, instead of re-serializing every checkpoint.
+    Without it, the whole trajectory is written to the cache file and any log removed.
 
     Args:
         trajectory: TrajectoryCache to save
+        persisted_checkpoints: Number of leading checkpoints already on disk
     """
     cache_path = get_trajectory_cache_path(trajectory.username)
+    log_path = _checkpoints_log_path(cache_path)
     tmp_path = cache_path.with_suffix('.json.tmp')
 
     try:
-        # Write to temp file first
-        with open(tmp_path, 'w', encoding='utf-8') as f:
-            json.dump(trajectory.model_dump(), f, indent=2, ensure_ascii=False)
-
-        # Atomic rename
-        tmp_path.rename(cache_path)
+        if persisted_checkpoints is None:
+            # Serialized directly by pydantic-core, no intermediate dict
+            _write_atomic(cache_path, tmp_path, trajectory.model_dump_json(indent=2).encode('utf-8'))
+            log_path.unlink(missing_ok=True)
+        else:
+            # Log first, header last: the header's total_checkpoints commits the new entries.
+            # A cache without a log yet (older format) moves all its checkpoints into it.
+            new_checkpoints = trajectory.checkpoints[persisted_checkpoints:] if log_path.exists() else trajectory.checkpoints
+            if new_checkpoints:
+                with open(log_path, 'ab') as f:
+                    f.write(b''.join(cp.model_dump_json().encode('utf-8') + b'\n' for cp in new_checkpoints))
+                    f.flush()
+                    os.fsync(f.fileno())
+            header = trajectory.model_dump_json(indent=2, exclude={'checkpoints'})
+            _write_atomic(cache_path, tmp_path, header.encode('utf-8'))
+
+        invalidate_trajectory_cache()
         print(f"[Trajectory] Saved cache for {trajectory.username} with {trajectory.total_checkpoints} checkpoints")
     except Exception as e:
         print(f"[Trajectory] Failed to save cache: {e}")
@@ -76,43 +186,78 @@ def save_trajectory_cache(trajectory: TrajectoryCache) -> None:
         raise
 
 
+def _write_atomic(path: Path, tmp_path: Path, data: bytes) -> None:
+    # Write to temp file first and flush to disk before the rename, so a crash can't
+    # leave an empty file
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    # Atomic rename (os.replace semantics, also on Windows), then persist the rename
+    tmp_path.replace(path)
+    _fsync_dir(path.parent)
+
+
+def clear_trajectory_checkpoints_log(username: str) -> None:
+    """Remove a user's checkpoint log (call when deleting their trajectory cache)."""
+    _checkpoints_log_path(get_trajectory_cache_path(username)).unlink(missing_ok=True)
+    invalidate_trajectory_cache()
+
+
+# (platform, compiled patterns) tried in order by parse_repo_url; every pattern contains
+# the platform name literally, so a URL without it can skip that platform's patterns
+_REPO_URL_PATTERNS = tuple(
+    (platform, tuple(re.compile(pattern) for pattern in patterns))
+    for platform, patterns in (
+        ('github', (
+            r'https?://(?:www\.)?github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+            r'github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+            r'git@github\.com:([^/]+)/([^/\s]+?)(?:\.git)?$',
+        )),
+        ('gitee', (
+            r'https?://(?:www\.)?gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+            r'gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+            r'git@gitee\.com:([^/]+)/([^/\s]+?)(?:\.git)?$',
+        )),
+    )
+)
+
+
+@lru_cache(maxsize=256)
 def parse_repo_url(repo_url: str) -> Tuple[str, str, str]:
     """
     Parse repository URL to extract platform, owner, and repo name.
 
+    Memoized: a trajectory run parses the same few URLs in every step.
+
     Args:
         repo_url: Repository URL (GitHub or Gitee)
 
     Returns:
         Tuple of (platform, owner, repo)
     """
-    import re
-
-    # GitHub patterns
-    github_patterns = [
-        r'https?://(?:www\.)?github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-        r'github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-        r'git@github\.com:([^/]+)/([^/\s]+?)(?:\.git)?$',
-    ]
+    url = repo_url.strip()
+    for platform, patterns in _REPO_URL_PATTERNS:
+        if platform not in url:
+            continue
+        for pattern in patterns:
+            match = pattern.match(url)
+            if match:
+                return (platform, match.group(1), match.group(2))
 
-    for pattern in github_patterns:
-        match = re.match(pattern, repo_url.strip())
-        if match:
-            return ('github', match.group(1), match.group(2))
+    raise ValueError(f"Unable to parse repository URL: {repo_url}")
 
-    # Gitee patterns
-    gitee_patterns = [
-        r'https?://(?:www\.)?gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-        r'gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-        r'git@gitee\.com:([^/]+)/([^/\s]+?)(?:\.git)?$',
-    ]
 
-    for pattern in gitee_patterns:
-        match = re.match(pattern, repo_url.strip())
-        if match:
-            return ('gitee', match.group(1), match.group(2))
+def _resolve_repo(repo_url: str) -> Tuple[str, str, str, Path]:
+    """
+    Resolve a repository URL to (platform, owner, repo, data_dir).
 
-    raise ValueError(f"Unable to parse repository URL: {repo_url}")
+    Not memoized itself: parse_repo_url and the data root lookup already are, and
+    data_dir must follow OSCANNER_DATA_DIR if it changes.
+    """
+    platform, owner, repo = parse_repo_url(repo_url)
+    return platform, owner, repo, get_platform_data_dir(platform, owner, repo)
 
 
 def ensure_repo_data_synced(repo_url: str, max_commits: int = 500) -> Tuple[str, str, str, bool]:
@@ -130,8 +275,7 @@ def ensure_repo_data_synced(repo_url: str, max_commits: int = 500) -> Tuple[str,
     Raises:
         Exception if extraction fails, with detailed error message
     """
-    platform, owner, repo = parse_repo_url(repo_url)
-    data_dir = get_platform_data_dir(platform, owner, repo)
+    platform, owner, repo, data_dir = _resolve_repo(repo_url)
 
     # Check if data already exists
     commits_index = data_dir / "commits_index.json"
@@ -184,6 +328,93 @@ def ensure_repo_data_synced(repo_url: str, max_commits: int = 500) -> Tuple[str,
 
 
 
+def _normalize_aliases(username: str, aliases: List[str]) -> FrozenSet[str]:
+    """Lowercase/strip aliases (plus the primary username) into a set for O(1) author checks."""
+    normalized_aliases = {alias.lower().strip() for alias in aliases if alias}
+    normalized_aliases.add(username.lower())
+    return frozenset(normalized_aliases)
+
+
+def _commit_sort_date(commit: Dict[str, Any]) -> str:
+    """Sort key for commits: the author date, falling back to a top-level date."""
+    return commit.get('commit', {}).get('author', {}).get('date', '') or commit.get('date', '')
+
+
+# Python 3.11+ parses a trailing 'Z' natively; older versions need it spelled '+00:00'
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=8192)
+def _parse_commit_date(date_str: str) -> datetime:
+    """
+    Parse an ISO 8601 commit date. Memoized: the same commits' dates are parsed again
+    when grouping periods, building checkpoint metadata and finding the start date.
+
+    Raises:
+        ValueError: If date_str is not ISO 8601
+    """
+    if _FROMISOFORMAT_ACCEPTS_Z:
+        return datetime.fromisoformat(date_str)
+    return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+
+
+def _map_repos(fn: Callable[[str], Any], repo_urls: List[str]) -> List[Any]:
+    """Apply fn to each repository URL in a small thread pool, preserving input order."""
+    if len(repo_urls) <= 1:
+        return [fn(repo_url) for repo_url in repo_urls]
+    with ThreadPoolExecutor(max_workers=min(8, len(repo_urls))) as executor:
+        return list(executor.map(fn, repo_urls))
+
+
+def _load_repo_new_commits(
+    repo_url: str,
+    username: str,
+    normalized_aliases: FrozenSet[str],
+    last_synced_sha: Optional[str]
+) -> Tuple[Optional[List[Tuple[str, Dict[str, Any]]]], List[str]]:
+    """
+    Load one repository's new commits by the given authors.
+
+    Returns:
+        Tuple of ((date, commit) pairs newest first, or None if the repo was skipped;
+        log lines to print)
+    """
+    messages = []
+    try:
+        platform, owner, repo, data_dir = _resolve_repo(repo_url)
+
+        if not data_dir.exists():
+            messages.append(f"[Trajectory] Warning: No local data for {repo_url}")
+            return None, messages
+
+        # Stream commits (newest first) and filter by author in one pass; with a
+        # last_synced_sha, stop as soon as the author's synced commit is reached so
+        # older commit files are never read
+        new_commits = []
+        loaded_count = 0
+        for commit in iter_commits_from_local(data_dir):
+            loaded_count += 1
+            if not is_commit_by_any_author(commit, normalized_aliases):
+                continue
+            if last_synced_sha and (commit.get('sha') or commit.get('hash')) == last_synced_sha:
+                break
+            new_commits.append((_commit_sort_date(commit), commit))
+
+        if not loaded_count:
+            messages.append(f"[Trajectory] No commits loaded from {platform}/{owner}/{repo}")
+            return None, messages
+
+        if last_synced_sha:
+            messages.append(f"[Trajectory] Loaded {loaded_count} commits, {len(new_commits)} new commits by {username} since {last_synced_sha[:8]} in {platform}/{owner}/{repo}")
+        else:
+            messages.append(f"[Trajectory] Loaded {loaded_count} total commits, {len(new_commits)} by {username} in {platform}/{owner}/{repo}")
+        return new_commits, messages
+
+    except Exception as e:
+        messages.append(f"[Trajectory] Error processing {repo_url}: {e}")
+        return None, messages
+
+
 def get_new_commits_from_repos(
     repo_urls: List[str],
     username: str,
@@ -202,64 +433,104 @@ def get_new_commits_from_repos(
     Returns:
         Tuple of (new_commits_count, new_commits_list, repos_analyzed)
     """
-    all_commits = []
+    # (date, commit) pairs: the date is extracted once, during the author-filter pass
+    dated_commits = []
     repos_analyzed = []
 
     # Normalize aliases
-    normalized_aliases = [alias.lower().strip() for alias in aliases if alias]
-    if username.lower() not in normalized_aliases:
-        normalized_aliases.append(username.lower())
+    normalized_aliases = _normalize_aliases(username, aliases)
 
-    for repo_url in repo_urls:
-        try:
-            platform, owner, repo = parse_repo_url(repo_url)
-            data_dir = get_platform_data_dir(platform, owner, repo)
+    # Repos are read in worker threads (the per-commit file reads overlap); log lines are
+    # collected per repo and printed afterwards, in repo_urls order
+    results = _map_repos(
+        lambda repo_url: _load_repo_new_commits(repo_url, username, normalized_aliases, last_synced_sha),
+        repo_urls
+    )
 
-            if not data_dir.exists():
-                print(f"[Trajectory] Warning: No local data for {repo_url}")
-                continue
+    for repo_url, (new_commits, messages) in zip(repo_urls, results):
+        for message in messages:
+            print(message)
+        if new_commits is None:
+            continue
+        dated_commits.extend(new_commits)
+        repos_analyzed.append(repo_url)
 
-            # Load all commits (they are ordered newest first)
-            commits = load_commits_from_local(data_dir, limit=None)
-            if not commits:
-                print(f"[Trajectory] No commits loaded from {platform}/{owner}/{repo}")
+    # Sort all commits by date (newest first). Each repo's commits are already a
+    # newest-first run, which the sort merges in roughly O(N log R); unlike heapq.merge
+    # it stays correct if a run is out of order.
+    dated_commits.sort(key=itemgetter(0), reverse=True)
+    all_commits = [commit for _, commit in dated_commits]
+
+    return len(all_commits), all_commits, repos_analyzed
+
+
+def get_latest_author_commit_sha(
+    repo_urls: List[str],
+    username: str,
+    aliases: List[str]
+) -> Optional[str]:
+    """
+    Find the newest commit by the author across the tracked repositories' local data.
+
+    Only reads each repo's commits_list.json (newest first), stopping at the first match.
+
+    Returns:
+        SHA of the newest matching commit, or None if any repo has no local commit list
+        or no commit by the author was found
+    """
+    normalized_aliases = _normalize_aliases(username, aliases)
+    latest_sha = None
+    latest_date = ''
+
+    for repo_url in repo_urls:
+        try:
+            data_dir = _resolve_repo(repo_url)[3]
+            # Parsed once per file version; this runs on every cached trajectory request
+            commits = load_commits_list_cached(data_dir / "commits_list.json")
+        except Exception:
+            return None
+
+        for commit in commits:
+            if not is_commit_by_any_author(commit, normalized_aliases):
                 continue
+            date_str = _commit_sort_date(commit)
+            if latest_sha is None or date_str > latest_date:
+                latest_sha = commit.get('sha') or commit.get('hash')
+                latest_date = date_str
+            break
 
-            # Filter by author
-            author_commits = [
-                c for c in commits
-                if any(is_commit_by_author(c, alias) for alias in normalized_aliases)
-            ]
+    return latest_sha
 
-            print(f"[Trajectory] Loaded {len(commits)} total commits, {len(author_commits)} by {username} in {platform}/{owner}/{repo}")
-
-            # If last_synced_sha exists, only take commits after it
-            if last_synced_sha:
-                new_commits = []
-                for commit in author_commits:
-                    commit_sha = commit.get('sha') or commit.get('hash')
-                    if commit_sha == last_synced_sha:
-                        break
-                    new_commits.append(commit)
-                print(f"[Trajectory] {len(new_commits)} new commits since {last_synced_sha[:8]}")
-                all_commits.extend(new_commits)
-            else:
-                all_commits.extend(author_commits)
 
-            repos_analyzed.append(repo_url)
+def create_trajectory_evaluator(
+    scan_mod: ModuleType,
+    repos_analyzed: List[str],
+    model: str,
+    language: str,
+    parallel_chunking: bool = True,
+    max_parallel_workers: int = 3
+) -> Any:
+    """
+    Create a plugin evaluator for trajectory checkpoints.
 
-        except Exception as e:
-            print(f"[Trajectory] Error processing {repo_url}: {e}")
-            continue
+    Uses the first analyzed repo's data dir (a placeholder github/unknown/unknown
+    if there is none).
+    """
+    if repos_analyzed:
+        platform, owner, repo = parse_repo_url(repos_analyzed[0])
+    else:
+        platform, owner, repo = 'github', 'unknown', 'unknown'
 
-    # Sort all commits by date (newest first)
-    all_commits.sort(
-        key=lambda c: c.get('commit', {}).get('author', {}).get('date', '') or c.get('date', ''),
-        reverse=True
+    return scan_mod.create_commit_evaluator(
+        data_dir=str(get_platform_data_dir(platform, owner, repo)),
+        api_key=get_llm_api_key(),
+        model=model,
+        mode="moderate",
+        language=language,
+        parallel_chunking=parallel_chunking,
+        max_parallel_workers=max_parallel_workers,
     )
 
-    return len(all_commits), all_commits, repos_analyzed
-
 
 def create_checkpoint_evaluation(
     commits: List[Dict[str, Any]],
@@ -273,7 +544,9 @@ def create_checkpoint_evaluation(
     repo_start_date: Optional[datetime] = None,
     previous_checkpoint: Optional[TrajectoryCheckpoint] = None,
     parallel_chunking: bool = True,
-    max_parallel_workers: int = 3
+    max_parallel_workers: int = 3,
+    plugin: Optional[Tuple[PluginMeta, ModuleType]] = None,
+    evaluator: Optional[Any] = None
 ) -> TrajectoryCheckpoint:
     """
     Create a checkpoint by evaluating commits (10+ commits).
@@ -291,6 +564,9 @@ def create_checkpoint_evaluation(
         previous_checkpoint: Previous checkpoint for comparison
         parallel_chunking: Enable parallel chunking
         max_parallel_workers: Max parallel workers
+        plugin: (meta, scan_module) already loaded for plugin_id; loaded here if None
+        evaluator: Evaluator reused across checkpoints of the same repo (keeps its file
+            and repo-structure caches); created here if None
 
     Returns:
         TrajectoryCheckpoint with evaluation result
@@ -301,7 +577,7 @@ def create_checkpoint_evaluation(
     # Sort commits oldest to newest for analysis
     sorted_commits = sorted(
         commits,
-        key=lambda c: c.get('commit', {}).get('author', {}).get('date', '') or c.get('date', ''),
+        key=_commit_sort_date,
         reverse=False
     )
 
@@ -317,34 +593,31 @@ def create_checkpoint_evaluation(
         period_end = None
         accumulated_periods = 1
 
-    # Create a temporary "platform" for evaluation
-    # Use the first repo URL to determine platform
-    if repos_analyzed:
-        platform, owner, repo = parse_repo_url(repos_analyzed[0])
-    else:
-        platform, owner, repo = 'github', 'unknown', 'unknown'
-
     # Create evaluator with previous checkpoint context
     # Extract previous scores if available
     previous_scores = None
     if previous_checkpoint:
         previous_scores = previous_checkpoint.evaluation.scores.model_dump()
-        print(f"[Trajectory] Passing previous checkpoint scores to evaluator: {list(previous_scores.keys())}")
-
-    # Load scan module and create evaluator
-    meta, scan_mod, _ = load_scan_module(plugin_id)
+        logger.debug("[Trajectory] Passing previous checkpoint scores to evaluator: %s", list(previous_scores))
 
-    # Create evaluator with previous checkpoint scores support
-    evaluator = scan_mod.create_commit_evaluator(
-        data_dir=str(get_platform_data_dir(platform, owner, repo)),
-        api_key=get_llm_api_key(),
-        model=model,
-        mode="moderate",
-        language=language,
-        parallel_chunking=parallel_chunking,
-        max_parallel_workers=max_parallel_workers,
-        previous_checkpoint_scores=previous_scores,
-    )
+    # Load scan module (once per trajectory run when passed in)
+    if plugin is None:
+        meta, scan_mod, _ = load_scan_module(plugin_id)
+    else:
+        meta, scan_mod = plugin
+
+    # Create evaluator with previous checkpoint scores support, or point the
+    # reused one at this checkpoint's previous scores
+    if evaluator is None:
+        evaluator = create_trajectory_evaluator(
+            scan_mod,
+            repos_analyzed=repos_analyzed,
+            model=model,
+            language=language,
+            parallel_chunking=parallel_chunking,
+            max_parallel_workers=max_parallel_workers,
+        )
+    evaluator.previous_checkpoint_scores = previous_scores
 
     # Evaluate
     print(f"[Trajectory] Evaluating checkpoint {checkpoint_id} with {len(commits)} commits (previous_checkpoint: {previous_checkpoint.checkpoint_id if previous_checkpoint else 'None'})")
@@ -356,10 +629,6 @@ def create_checkpoint_evaluation(
         use_chunking=True
     )
 
-    # Debug: Check type of evaluation_result
-    print(f"[Trajectory] evaluation_result type: {type(evaluation_result)}")
-    print(f"[Trajectory] evaluation_result keys: {list(evaluation_result.keys()) if isinstance(evaluation_result, dict) else 'NOT A DICT'}")
-
     # Ensure evaluation_result is a dict
     if not isinstance(evaluation_result, dict):
         raise TypeError(f"Expected dict from evaluate_engineer, got {type(evaluation_result)}")
@@ -368,29 +637,26 @@ def create_checkpoint_evaluation(
     evaluation_result['evaluated_at'] = datetime.utcnow().isoformat()
     evaluation_result['plugin'] = plugin_id
 
-    # Load plugin version
-    try:
-        meta, _, _ = load_scan_module(plugin_id)
-        evaluation_result['plugin_version'] = meta.version
-    except Exception as e:
-        print(f"[Trajectory] Warning: Failed to load plugin version: {e}")
-        evaluation_result['plugin_version'] = '0.1.0'
+    evaluation_result['plugin_version'] = meta.version or '0.1.0'
 
     # Convert to EvaluationSchema
     try:
         evaluation = EvaluationSchema(**evaluation_result)
     except Exception as e:
-        print(f"[Trajectory] Validation error details:")
-        print(f"[Trajectory] evaluation_result keys: {list(evaluation_result.keys())}")
-        print(f"[Trajectory] evaluation_result: {json.dumps(evaluation_result, indent=2, default=str)}")
+        print(f"[Trajectory] Validation error: {e}")
+        logger.debug("[Trajectory] evaluation_result keys: %s", list(evaluation_result))
+        # Dumping the full result can be hundreds of KB; only serialize it when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[Trajectory] evaluation_result: %s", json.dumps(evaluation_result, indent=2, default=str))
         raise
 
     # Calculate growth comparison if previous checkpoint exists
     growth_comparison = None
     if previous_checkpoint:
+        # previous_scores was dumped above for the evaluator (which only reads it); reuse it
         growth_comparison = calculate_growth_comparison(
             current_scores=evaluation.scores.model_dump(),
-            previous_scores=previous_checkpoint.evaluation.scores.model_dump()
+            previous_scores=previous_scores
         )
 
     # Create checkpoint
@@ -432,13 +698,14 @@ def calculate_growth_comparison(
     dimension_changes = {}
     improved_dimensions = []
     regressed_dimensions = []
+    total_improvement = 0
+    total_regression = 0
 
-    # Compare each dimension
-    for key in current_scores.keys():
+    # Compare each dimension, summing the magnitudes in the same pass
+    for key, current_val in current_scores.items():
         if key == 'reasoning':
             continue
 
-        current_val = current_scores.get(key)
         previous_val = previous_scores.get(key)
 
         # Only compare if both have numeric values
@@ -448,8 +715,10 @@ def calculate_growth_comparison(
 
             if change > 0:
                 improved_dimensions.append(key)
+                total_improvement += change
             elif change < 0:
                 regressed_dimensions.append(key)
+                total_regression -= change
 
     # Determine overall trend
     if improved_dimensions and not regressed_dimensions:
@@ -458,8 +727,6 @@ def calculate_growth_comparison(
         overall_trend = "decreasing"
     elif improved_dimensions and regressed_dimensions:
         # Mixed: determine by magnitude
-        total_improvement = sum(dimension_changes[d] for d in improved_dimensions)
-        total_regression = sum(abs(dimension_changes[d]) for d in regressed_dimensions)
         if total_improvement > total_regression:
             overall_trend = "increasing"
         elif total_regression > total_improvement:
@@ -477,6 +744,67 @@ def calculate_growth_comparison(
     }
 
 
+def _is_iso_date_prefix(date_str: str) -> bool:
+    """Cheap check that a string starts with YYYY-MM-DD."""
+    return (
+        len(date_str) >= 10
+        and date_str[4] == '-'
+        and date_str[7] == '-'
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:10].isdigit()
+    )
+
+
+def _count_repo_commits_by_date(repo_url: str, normalized_aliases: FrozenSet[str]) -> Optional[Counter]:
+    """
+    Count one repository's commits by the given authors per YYYY-MM-DD day.
+
+    Returns None if the repository's commits could not be read, so callers don't
+    cache a partial result.
+    """
+    commits_by_date = Counter()
+    try:
+        platform, owner, repo, data_dir = _resolve_repo(repo_url)
+
+        if not data_dir.exists():
+            print(f"[Trajectory] Warning: No local data for {repo_url}")
+            return commits_by_date
+
+        # Load commits_list.json directly (contains all commits)
+        commits_list_path = data_dir / "commits_list.json"
+        if not commits_list_path.exists():
+            print(f"[Trajectory] Warning: commits_list.json not found in {data_dir}")
+            return commits_by_date
+
+        # Stream commits one at a time, filter by author and bucket by the YYYY-MM-DD prefix
+        # of commit.author.date (ISO 8601 in the committer's own offset, same day
+        # fromisoformat() would give)
+        author_dates = (
+            commit.get('commit', {}).get('author', {}).get('date', '')
+            for commit in iter_json_array(commits_list_path)
+            if is_commit_by_any_author(commit, normalized_aliases)
+        )
+        day_counts = Counter(d[:10] for d in author_dates)
+        # Validate each distinct day once rather than every commit's date
+        commits_by_date.update({day: n for day, n in day_counts.items() if _is_iso_date_prefix(day)})
+
+    except Exception as e:
+        print(f"[Trajectory] Error processing {repo_url}: {e}")
+        return None
+
+    return commits_by_date
+
+
+def _commits_by_date_result(username: str, commits_by_date: Counter) -> List[Dict[str, Any]]:
+    result = [
+        {"date": date, "count": count}
+        for date, count in sorted(commits_by_date.items())
+    ]
+    print(f"[Trajectory] Found {len(result)} days with commits for {username}")
+    return result
+
+
 def get_commits_by_date(
     username: str,
     repo_urls: List[str],
@@ -493,72 +821,179 @@ def get_commits_by_date(
     Returns:
         List of {date: "YYYY-MM-DD", count: int} sorted by date
     """
-    from collections import defaultdict
+    normalized_aliases = _normalize_aliases(username, aliases)
 
-    # Normalize aliases
-    normalized_aliases = [alias.lower().strip() for alias in aliases if alias]
-    if username.lower() not in normalized_aliases:
-        normalized_aliases.append(username.lower())
+    commits_by_date = Counter()
+    for counts in _map_repos(lambda repo_url: _count_repo_commits_by_date(repo_url, normalized_aliases), repo_urls):
+        if counts is not None:
+            commits_by_date.update(counts)
 
-    # Collect all commits by date
-    commits_by_date = defaultdict(int)
+    return _commits_by_date_result(username, commits_by_date)
 
-    for repo_url in repo_urls:
+
+def _commits_by_date_cache_key(
+    repo_urls: List[str],
+    normalized_aliases: FrozenSet[str],
+    last_synced_sha: Optional[str]
+) -> str:
+    """
+    Build the sidecar cache key from the tracked repos, aliases, trajectory SHA and
+    the stat of each repo's commits_list.json (so re-extracted data is picked up).
+    """
+    stats = []
+    for repo_url in sorted(repo_urls):
         try:
-            platform, owner, repo = parse_repo_url(repo_url)
-            data_dir = get_platform_data_dir(platform, owner, repo)
+            st = (_resolve_repo(repo_url)[3] / "commits_list.json").stat()
+            stats.append([st.st_mtime_ns, st.st_size])
+        except Exception:
+            stats.append(None)
+    payload = json.dumps([sorted(repo_urls), sorted(normalized_aliases), last_synced_sha, stats])
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
 
-            if not data_dir.exists():
-                print(f"[Trajectory] Warning: No local data for {repo_url}")
-                continue
 
-            # Load commits_list.json directly (contains all commits)
-            commits_list_path = data_dir / "commits_list.json"
-            if not commits_list_path.exists():
-                print(f"[Trajectory] Warning: commits_list.json not found in {data_dir}")
-                continue
+def _load_commits_by_date_sidecar(username: str, cache_key: str) -> Optional[Counter]:
+    """Load cached per-day counts if the sidecar was written for the same key."""
+    try:
+        with open(get_commits_by_date_cache_path(username), 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[Trajectory] Failed to load commits-by-date cache: {e}")
+        return None
 
-            with open(commits_list_path, 'r', encoding='utf-8') as f:
-                commits = json.load(f)
+    if sidecar.get('key') != cache_key:
+        return None
+    return Counter(sidecar.get('counts', {}))
 
-            if not commits:
-                continue
 
-            # Filter by author and group by date
-            for commit in commits:
-                # Check if commit is by this author
-                if not any(is_commit_by_author(commit, alias) for alias in normalized_aliases):
-                    continue
+def _save_commits_by_date_sidecar(username: str, cache_key: str, commits_by_date: Counter) -> None:
+    """Persist per-day counts as a compact {date: count} sidecar (atomic write)."""
+    cache_path = get_commits_by_date_cache_path(username)
+    tmp_path = cache_path.with_suffix('.json.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': cache_key, 'counts': commits_by_date}, f, separators=(',', ':'))
+        tmp_path.replace(cache_path)
+    except Exception as e:
+        print(f"[Trajectory] Failed to save commits-by-date cache: {e}")
+        if tmp_path.exists():
+            tmp_path.unlink()
 
-                # Extract date from commit.author.date
-                commit_data = commit.get('commit', {})
-                author_data = commit_data.get('author', {})
-                date_str = author_data.get('date', '')
 
-                if not date_str:
-                    continue
+def clear_commits_by_date_cache(username: str) -> None:
+    """Remove the commits-by-date sidecar for a user, if any."""
+    get_commits_by_date_cache_path(username).unlink(missing_ok=True)
 
-                # Parse ISO 8601 date and extract YYYY-MM-DD
-                try:
-                    date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    date_only = date_obj.strftime('%Y-%m-%d')
-                    commits_by_date[date_only] += 1
-                except Exception as e:
-                    print(f"[Trajectory] Warning: Failed to parse date {date_str}: {e}")
-                    continue
 
-        except Exception as e:
-            print(f"[Trajectory] Error processing {repo_url}: {e}")
-            continue
+async def count_commits_by_date_async(
+    username: str,
+    repo_urls: List[str],
+    aliases: List[str],
+    last_synced_sha: Optional[str] = None
+) -> Counter:
+    """
+    Count commits per YYYY-MM-DD day across repositories, loading them concurrently
+    in worker threads.
 
-    # Convert to sorted list
-    result = [
-        {"date": date, "count": count}
-        for date, count in sorted(commits_by_date.items())
-    ]
+    When last_synced_sha is given, counts are cached in a sidecar file next to the
+    trajectory cache and reused while the SHA and local commit data are unchanged.
 
-    print(f"[Trajectory] Found {len(result)} days with commits for {username}")
-    return result
+    Returns the raw Counter so callers can stream rows without materializing
+    the {date, count} list.
+    """
+    normalized_aliases = _normalize_aliases(username, aliases)
+
+    cache_key = None
+    if last_synced_sha:
+        cache_key = await asyncio.to_thread(_commits_by_date_cache_key, repo_urls, normalized_aliases, last_synced_sha)
+        cached = await asyncio.to_thread(_load_commits_by_date_sidecar, username, cache_key)
+        if cached is not None:
+            return cached
+
+    per_repo = await asyncio.gather(*(
+        asyncio.to_thread(_count_repo_commits_by_date, repo_url, normalized_aliases)
+        for repo_url in repo_urls
+    ))
+
+    commits_by_date = Counter()
+    for counts in per_repo:
+        if counts is not None:
+            commits_by_date.update(counts)
+
+    # A repo that failed to load contributed nothing; don't pin that under an unchanged key
+    if cache_key and all(counts is not None for counts in per_repo):
+        await asyncio.to_thread(_save_commits_by_date_sidecar, username, cache_key, commits_by_date)
+
+    return commits_by_date
+
+
+async def get_commits_by_date_async(
+    username: str,
+    repo_urls: List[str],
+    aliases: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of get_commits_by_date: repositories are loaded concurrently
+    in worker threads and their per-day counts summed.
+    """
+    commits_by_date = await count_commits_by_date_async(username, repo_urls, aliases)
+    return _commits_by_date_result(username, commits_by_date)
+
+
+def _repo_oldest_author_commit_date(
+    repo_url: str,
+    normalized_aliases: FrozenSet[str]
+) -> Tuple[Optional[datetime], Optional[str], List[str]]:
+    """
+    Find the date of the oldest commit by the given authors in one repository.
+
+    Returns:
+        Tuple of (commit date or None, "platform/owner/repo" label, log lines to print)
+    """
+    messages = []
+    try:
+        platform, owner, repo, data_dir = _resolve_repo(repo_url)
+        repo_label = f"{platform}/{owner}/{repo}"
+
+        if not data_dir.exists():
+            messages.append(f"[Trajectory] Warning: No local data for {repo_url}")
+            return None, repo_label, messages
+
+        # The (cached) commits_list.json summaries carry the author and date, so the
+        # per-commit detail files are only read for data extracted without one
+        try:
+            commits = load_commits_list_cached(data_dir / "commits_list.json")
+        except FileNotFoundError:
+            commits = load_commits_from_local(data_dir, limit=None)
+        if not commits:
+            return None, repo_label, messages
+
+        # Filter by author
+        author_commits = [
+            c for c in commits
+            if is_commit_by_any_author(c, normalized_aliases)
+        ]
+
+        if not author_commits:
+            return None, repo_label, messages
+
+        # Find oldest commit (commits are ordered newest first)
+        date_str = _commit_sort_date(author_commits[-1])
+
+        if not date_str:
+            return None, repo_label, messages
+
+        # Parse ISO 8601 date
+        try:
+            return _parse_commit_date(date_str), repo_label, messages
+        except Exception as e:
+            messages.append(f"[Trajectory] Warning: Failed to parse date {date_str}: {e}")
+            return None, repo_label, messages
+
+    except Exception as e:
+        messages.append(f"[Trajectory] Error processing {repo_url}: {e}")
+        return None, None, messages
 
 
 def get_repo_start_date(
@@ -578,57 +1013,18 @@ def get_repo_start_date(
         Datetime of earliest commit, or None if no commits found
     """
     # Normalize aliases
-    normalized_aliases = [alias.lower().strip() for alias in aliases if alias]
-    if username.lower() not in normalized_aliases:
-        normalized_aliases.append(username.lower())
+    normalized_aliases = _normalize_aliases(username, aliases)
 
     earliest_date = None
 
-    for repo_url in repo_urls:
-        try:
-            platform, owner, repo = parse_repo_url(repo_url)
-            data_dir = get_platform_data_dir(platform, owner, repo)
+    results = _map_repos(lambda repo_url: _repo_oldest_author_commit_date(repo_url, normalized_aliases), repo_urls)
 
-            if not data_dir.exists():
-                print(f"[Trajectory] Warning: No local data for {repo_url}")
-                continue
-
-            # Load commits
-            commits = load_commits_from_local(data_dir, limit=None)
-            if not commits:
-                continue
-
-            # Filter by author
-            author_commits = [
-                c for c in commits
-                if any(is_commit_by_author(c, alias) for alias in normalized_aliases)
-            ]
-
-            if not author_commits:
-                continue
-
-            # Find oldest commit (commits are ordered newest first)
-            oldest_commit = author_commits[-1]
-            commit_data = oldest_commit.get('commit', {})
-            author_data = commit_data.get('author', {})
-            date_str = author_data.get('date', '') or oldest_commit.get('date', '')
-
-            if not date_str:
-                continue
-
-            # Parse ISO 8601 date
-            try:
-                commit_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                if earliest_date is None or commit_date < earliest_date:
-                    earliest_date = commit_date
-                    print(f"[Trajectory] Found earliest commit in {platform}/{owner}/{repo}: {commit_date.isoformat()}")
-            except Exception as e:
-                print(f"[Trajectory] Warning: Failed to parse date {date_str}: {e}")
-                continue
-
-        except Exception as e:
-            print(f"[Trajectory] Error processing {repo_url}: {e}")
-            continue
+    for commit_date, repo_label, messages in results:
+        for message in messages:
+            print(message)
+        if commit_date is not None and (earliest_date is None or commit_date < earliest_date):
+            earliest_date = commit_date
+            print(f"[Trajectory] Found earliest commit in {repo_label}: {commit_date.isoformat()}")
 
     return earliest_date
 
@@ -652,67 +1048,78 @@ def group_commits_by_period(
         - remaining_commit_shas: SHAs of commits not yet forming a checkpoint
         - periods_accumulated: Number of periods that contributed to the last checkpoint
     """
-    # Sort commits oldest to newest (chronological order)
-    sorted_commits = sorted(
-        commits,
-        key=lambda c: c.get('commit', {}).get('author', {}).get('date', '') or c.get('date', ''),
-        reverse=False
-    )
+    # Pair each commit with its date string once, walking the newest-first input backwards
+    # so it is already oldest to newest (chronological order). Commits sharing a timestamp
+    # stay in git's order. The stable sort only guards the contract: on ordered input it is
+    # a single linear pass.
+    dated_commits = [(_commit_sort_date(c), c) for c in reversed(commits)]
+    dated_commits.sort(key=itemgetter(0))
 
     # Initialize accumulation buffer with previously accumulated commits
     if accumulated_shas:
-        # Find previously accumulated commits in the sorted list
-        accumulated_commits = [c for c in sorted_commits if (c.get('sha') or c.get('hash')) in accumulated_shas]
-        # Remove them from sorted list to avoid double-counting
-        sorted_commits = [c for c in sorted_commits if (c.get('sha') or c.get('hash')) not in accumulated_shas]
+        accumulated_set = frozenset(accumulated_shas)
+        # Partition the sorted list in one pass: previously accumulated commits seed the
+        # buffer and are removed from the rest to avoid double-counting
+        accumulated_commits = []
+        remaining = []
+        for date_str, commit in dated_commits:
+            if (commit.get('sha') or commit.get('hash')) in accumulated_set:
+                accumulated_commits.append(commit)
+            else:
+                remaining.append((date_str, commit))
+        dated_commits = remaining
         print(f"[Trajectory] Loaded {len(accumulated_commits)} previously accumulated commits")
     else:
         accumulated_commits = []
 
     checkpoint_groups = []
 
-    # Group commits by 2-week periods
-    periods = {}  # {period_index: [commits]}
-    for commit in sorted_commits:
-        # Get commit date
-        commit_data = commit.get('commit', {})
-        author_data = commit_data.get('author', {})
-        date_str = author_data.get('date', '') or commit.get('date', '')
-
+    # Tag each commit with its 2-week period index
+    period_commits_pairs = []  # [(period_index, commit)]
+    for date_str, commit in dated_commits:
         if not date_str:
             print(f"[Trajectory] Warning: Commit without date, skipping")
             continue
 
         try:
-            commit_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            commit_date = _parse_commit_date(date_str)
         except Exception as e:
             print(f"[Trajectory] Warning: Failed to parse date {date_str}: {e}")
             continue
 
         # Calculate which 2-week period this commit falls into
         days_from_start = (commit_date - repo_start_date).days
-        period_index = days_from_start // 14
+        period_commits_pairs.append((days_from_start // 14, commit))
 
-        if period_index not in periods:
-            periods[period_index] = []
-        periods[period_index].append(commit)
+    # Bucket by period with a stable sort (commits are already in date order, so this
+    # is nearly linear) and walk the runs in order
+    period_commits_pairs.sort(key=itemgetter(0))
 
-    # Process periods in order
+    # Process periods in order (per-period detail is logged at debug level; a long
+    # history has hundreds of periods)
     periods_accumulated = 0
-    for period_index in sorted(periods.keys()):
-        period_commits = periods[period_index]
+    periods_seen = 0
+    for period_index, pairs in groupby(period_commits_pairs, key=itemgetter(0)):
+        period_commits = [commit for _, commit in pairs]
+        periods_seen += 1
 
         # Add period commits to accumulation
         accumulated_commits.extend(period_commits)
         periods_accumulated += 1
 
-        print(f"[Trajectory] Period {period_index}: added {len(period_commits)} commits (total accumulated: {len(accumulated_commits)})")
+        logger.debug(
+            "[Trajectory] Period %d: added %d commits (total accumulated: %d)",
+            period_index, len(period_commits), len(accumulated_commits)
+        )
 
         # Check if we have enough commits for a checkpoint
         if len(accumulated_commits) >= 10:
             # Create checkpoint with ALL accumulated commits
             checkpoint_groups.append(accumulated_commits.copy())
-            print(f"[Trajectory] Created checkpoint group with {len(accumulated_commits)} commits (accumulated from {periods_accumulated} periods)")
+            logger.debug(
+                "[Trajectory] Created checkpoint group with %d commits (accumulated from %d periods)",
+                len(accumulated_commits), periods_accumulated
+            )
 
             # Reset accumulation
             accumulated_commits = []
@@ -721,7 +1128,7 @@ def group_commits_by_period(
     # Extract SHAs of remaining commits
     remaining_shas = [(c.get('sha') or c.get('hash')) for c in accumulated_commits]
 
-    print(f"[Trajectory] Grouping complete: {len(checkpoint_groups)} checkpoint groups, {len(remaining_shas)} commits remaining")
+    print(f"[Trajectory] Grouping complete: {len(checkpoint_groups)} checkpoint groups from {periods_seen} periods, {len(remaining_shas)} commits remaining")
 
     return checkpoint_groups, remaining_shas, periods_accumulated
 
@@ -743,14 +1150,11 @@ def build_period_metadata(
     # Find earliest and latest commit dates
     dates = []
     for commit in commits:
-        commit_data = commit.get('commit', {})
-        author_data = commit_data.get('author', {})
-        date_str = author_data.get('date', '') or commit.get('date', '')
+        date_str = _commit_sort_date(commit)
 
         if date_str:
             try:
-                commit_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                dates.append(commit_date)
+                dates.append(_parse_commit_date(date_str))
             except Exception:
                 continue
 
@@ -777,6 +1181,45 @@ def build_period_metadata(
     return period_start.isoformat(), period_end_latest.isoformat(), periods_spanned
 
 
+def _update_accumulation_state(
+    trajectory: TrajectoryCache,
+    repo_start_date: datetime,
+    remaining_shas: List[str]
+) -> None:
+    """Record the commits still waiting for a checkpoint and the current 2-week period."""
+    weeks_elapsed = (datetime.now(repo_start_date.tzinfo) - repo_start_date).days // 14
+    current_period_start = repo_start_date + timedelta(weeks=2 * weeks_elapsed)
+    current_period_end = current_period_start + timedelta(weeks=2)
+
+    trajectory.accumulation_state = PeriodAccumulationState(
+        current_period_start=current_period_start.isoformat(),
+        current_period_end=current_period_end.isoformat(),
+        accumulated_commits=remaining_shas,
+        repo_start_date=repo_start_date.isoformat()
+    )
+
+
+def _wait_for_progress_save(
+    pending_save: Optional[Tuple[Future, Optional[int]]],
+    persisted_checkpoints: Optional[int]
+) -> Optional[int]:
+    """
+    Wait for a background progress save and return how many checkpoints are on disk.
+
+    If the save failed, the count from before it is returned so the next save writes
+    those checkpoints again.
+    """
+    if pending_save is None:
+        return persisted_checkpoints
+    future, persisted_before = pending_save
+    try:
+        future.result()
+    except Exception as e:
+        print(f"[Trajectory] Warning: Failed to save progress: {e}")
+        return persisted_before
+    return persisted_checkpoints
+
+
 def analyze_growth_trajectory(
     username: str,
     repo_urls: List[str],
@@ -812,8 +1255,13 @@ def analyze_growth_trajectory(
         username = ','.join(sorted(authors))
         print(f"[Trajectory] Normalized grouped username: {username}")
 
-    # Load existing trajectory
+    # Load existing trajectory (copied: it is mutated below and the loaded instance is shared)
     trajectory = load_trajectory_cache(username) if use_cache else None
+    # Checkpoints already on disk; saves then only append the ones created in this run
+    persisted_checkpoints = None
+    if trajectory is not None:
+        trajectory = trajectory.model_copy(deep=True)
+        persisted_checkpoints = len(trajectory.checkpoints)
 
     if trajectory is None:
         print(f"[Trajectory] No cache found for {username}, initializing")
@@ -832,21 +1280,29 @@ def analyze_growth_trajectory(
     # Ensure all repos have data synced
     print(f"[Trajectory] Ensuring data is synced for {len(repo_urls)} repositories")
     sync_errors = []
-    for repo_url in repo_urls:
-        try:
-            platform, owner, repo, was_synced = ensure_repo_data_synced(repo_url, max_commits=500)
-            if was_synced:
-                print(f"[Trajectory] Extracted fresh data for {platform}/{owner}/{repo}")
-        except Exception as e:
-            error_msg = str(e)
-            print(f"[Trajectory] Warning: Failed to sync {repo_url}: {error_msg}")
-            # Check if it's a network/DNS error
-            if "Failed to resolve" in error_msg or "NameResolutionError" in error_msg or "nodename nor servname" in error_msg:
-                sync_errors.append(f"Network error: Cannot connect to {repo_url}. Please check your internet connection and DNS settings.")
-            elif "HTTPSConnectionPool" in error_msg or "Max retries exceeded" in error_msg:
-                sync_errors.append(f"Connection error: Cannot reach {repo_url}. Please check your network connection.")
-            else:
-                sync_errors.append(f"Failed to extract data from {repo_url}: {error_msg}")
+    if repo_urls:
+        # Syncs are independent network-bound extractions; run them concurrently and
+        # collect errors in repo_urls order so one failure doesn't abort the others
+        with ThreadPoolExecutor(max_workers=min(8, len(repo_urls))) as executor:
+            futures = [
+                executor.submit(ensure_repo_data_synced, repo_url, max_commits=500)
+                for repo_url in repo_urls
+            ]
+            for repo_url, future in zip(repo_urls, futures):
+                try:
+                    platform, owner, repo, was_synced = future.result()
+                    if was_synced:
+                        print(f"[Trajectory] Extracted fresh data for {platform}/{owner}/{repo}")
+                except Exception as e:
+                    error_msg = str(e)
+                    print(f"[Trajectory] Warning: Failed to sync {repo_url}: {error_msg}")
+                    # Check if it's a network/DNS error
+                    if "Failed to resolve" in error_msg or "NameResolutionError" in error_msg or "nodename nor servname" in error_msg:
+                        sync_errors.append(f"Network error: Cannot connect to {repo_url}. Please check your internet connection and DNS settings.")
+                    elif "HTTPSConnectionPool" in error_msg or "Max retries exceeded" in error_msg:
+                        sync_errors.append(f"Connection error: Cannot reach {repo_url}. Please check your network connection.")
+                    else:
+                        sync_errors.append(f"Failed to extract data from {repo_url}: {error_msg}")
 
     # Get new commits
     new_commits_count, new_commits, repos_analyzed = get_new_commits_from_repos(
@@ -908,20 +1364,10 @@ def analyze_growth_trajectory(
     # Check if we have any checkpoint groups
     if not checkpoint_groups:
         # Update accumulation state
-        current_period_start = repo_start_date
-        weeks_elapsed = (datetime.now(repo_start_date.tzinfo) - repo_start_date).days // 14
-        current_period_start = repo_start_date + timedelta(weeks=2 * weeks_elapsed)
-        current_period_end = current_period_start + timedelta(weeks=2)
-
-        trajectory.accumulation_state = PeriodAccumulationState(
-            current_period_start=current_period_start.isoformat(),
-            current_period_end=current_period_end.isoformat(),
-            accumulated_commits=remaining_shas,
-            repo_start_date=repo_start_date.isoformat()
-        )
+        _update_accumulation_state(trajectory, repo_start_date, remaining_shas)
 
         # Save state
-        save_trajectory_cache(trajectory)
+        save_trajectory_cache(trajectory, persisted_checkpoints)
 
         return TrajectoryResponse(
             success=True,
@@ -934,53 +1380,79 @@ def analyze_growth_trajectory(
     # Create checkpoints for each group
     checkpoints_created = 0
     commits_processed = 0
+    # (future, checkpoints persisted before it) of the background progress save, if any
+    pending_save = None
 
     try:
-        for group_commits in checkpoint_groups:
-            # Get previous checkpoint for comparison
-            previous_checkpoint = trajectory.checkpoints[-1] if trajectory.checkpoints else None
-
-            checkpoint = create_checkpoint_evaluation(
-                commits=group_commits,
-                username=username,
-                checkpoint_id=trajectory.total_checkpoints + 1,
-                plugin_id=plugin_id,
-                model=model,
-                language=language,
-                repos_analyzed=repos_analyzed,
-                aliases_used=aliases,
-                repo_start_date=repo_start_date,
-                previous_checkpoint=previous_checkpoint,
-                parallel_chunking=parallel_chunking,
-                max_parallel_workers=max_parallel_workers
-            )
+        # Load the plugin once for all checkpoints of this run (each load re-executes the module)
+        meta, scan_mod, _ = load_scan_module(plugin_id)
+        # Likewise one evaluator, so its file/repo-structure caches carry across checkpoints
+        evaluator = create_trajectory_evaluator(
+            scan_mod,
+            repos_analyzed=repos_analyzed,
+            model=model,
+            language=language,
+            parallel_chunking=parallel_chunking,
+            max_parallel_workers=max_parallel_workers,
+        )
+
+        save_every = max(1, len(checkpoint_groups) // 4)
+
+        with ThreadPoolExecutor(max_workers=1) as saver:
+            # Sequential on purpose: each evaluation is prompted with the previous checkpoint's
+            # scores and compared against them, so checkpoint N+1 can't start before N finishes
+            for group_commits in checkpoint_groups:
+                # Get previous checkpoint for comparison
+                previous_checkpoint = trajectory.checkpoints[-1] if trajectory.checkpoints else None
+
+                checkpoint = create_checkpoint_evaluation(
+                    commits=group_commits,
+                    username=username,
+                    checkpoint_id=trajectory.total_checkpoints + 1,
+                    plugin_id=plugin_id,
+                    model=model,
+                    language=language,
+                    repos_analyzed=repos_analyzed,
+                    aliases_used=aliases,
+                    repo_start_date=repo_start_date,
+                    previous_checkpoint=previous_checkpoint,
+                    parallel_chunking=parallel_chunking,
+                    max_parallel_workers=max_parallel_workers,
+                    plugin=(meta, scan_mod),
+                    evaluator=evaluator
+                )
 
-            # Update trajectory
-            trajectory.checkpoints.append(checkpoint)
-            trajectory.total_checkpoints += 1
-            trajectory.last_synced_sha = checkpoint.commits_range.end_sha
-            trajectory.last_synced_at = checkpoint.created_at
+                # Update trajectory
+                trajectory.checkpoints.append(checkpoint)
+                trajectory.total_checkpoints += 1
+                trajectory.last_synced_sha = checkpoint.commits_range.end_sha
+                trajectory.last_synced_at = checkpoint.created_at
 
-            commits_processed += len(group_commits)
-            checkpoints_created += 1
+                commits_processed += len(group_commits)
+                checkpoints_created += 1
 
-            print(f"[Trajectory] Created checkpoint {checkpoint.checkpoint_id} with {len(group_commits)} commits ({commits_processed} commits processed)")
+                print(f"[Trajectory] Created checkpoint {checkpoint.checkpoint_id} with {len(group_commits)} commits ({commits_processed} commits processed)")
+
+                # Persist progress a few times per run rather than after every checkpoint (each
+                # save fsyncs), so a killed process keeps most of the evaluated checkpoints.
+                # Saves run on a background thread, at most one in flight, so the next
+                # evaluation doesn't wait on the disk
+                if checkpoints_created % save_every == 0 and checkpoints_created < len(checkpoint_groups):
+                    persisted_checkpoints = _wait_for_progress_save(pending_save, persisted_checkpoints)
+                    # Snapshot: the loop keeps appending to trajectory.checkpoints
+                    snapshot = trajectory.model_copy(update={'checkpoints': list(trajectory.checkpoints)})
+                    pending_save = (saver.submit(save_trajectory_cache, snapshot, persisted_checkpoints), persisted_checkpoints)
+                    persisted_checkpoints = len(trajectory.checkpoints)
+
+        # The final save below is synchronous; let the last progress save land first
+        persisted_checkpoints = _wait_for_progress_save(pending_save, persisted_checkpoints)
+        pending_save = None
 
         # Update accumulation state with remaining commits
-        current_period_start = repo_start_date
-        weeks_elapsed = (datetime.now(repo_start_date.tzinfo) - repo_start_date).days // 14
-        current_period_start = repo_start_date + timedelta(weeks=2 * weeks_elapsed)
-        current_period_end = current_period_start + timedelta(weeks=2)
-
-        trajectory.accumulation_state = PeriodAccumulationState(
-            current_period_start=current_period_start.isoformat(),
-            current_period_end=current_period_end.isoformat(),
-            accumulated_commits=remaining_shas,
-            repo_start_date=repo_start_date.isoformat()
-        )
+        _update_accumulation_state(trajectory, repo_start_date, remaining_shas)
 
         # Save to cache after all checkpoints created
-        save_trajectory_cache(trajectory)
+        save_trajectory_cache(trajectory, persisted_checkpoints)
 
         pending_count = len(remaining_shas)
         if checkpoints_created == 1:
@@ -1001,26 +1473,16 @@ def analyze_growth_trajectory(
 
     except Exception as e:
         print(f"[Trajectory] Failed to create checkpoint: {e}")
-        import traceback
         traceback.print_exc()
 
         # Save any checkpoints that were successfully created
+        persisted_checkpoints = _wait_for_progress_save(pending_save, persisted_checkpoints)
         if checkpoints_created > 0:
             try:
                 # Update accumulation state before saving
-                current_period_start = repo_start_date
-                weeks_elapsed = (datetime.now(repo_start_date.tzinfo) - repo_start_date).days // 14
-                current_period_start = repo_start_date + timedelta(weeks=2 * weeks_elapsed)
-                current_period_end = current_period_start + timedelta(weeks=2)
-
-                trajectory.accumulation_state = PeriodAccumulationState(
-                    current_period_start=current_period_start.isoformat(),
-                    current_period_end=current_period_end.isoformat(),
-                    accumulated_commits=remaining_shas,
-                    repo_start_date=repo_start_date.isoformat()
-                )
+                _update_accumulation_state(trajectory, repo_start_date, remaining_shas)
 
-                save_trajectory_cache(trajectory)
+                save_trajectory_cache(trajectory, persisted_checkpoints)
             except Exception as save_error:
                 print(f"[Trajectory] Failed to save partial progress: {save_error}")
 
@@ -1,13 +1,28 @@
 """Utility modules for the evaluator package."""
 
 from evaluator.utils.repo_parser import parse_repo_url, parse_github_url
-from evaluator.utils.commit_utils import get_author_from_commit, is_commit_by_author
-from evaluator.utils.data_loader import load_commits_from_local
+from evaluator.utils.commit_utils import (
+    get_author_from_commit,
+    get_commit_author_key,
+    is_commit_by_author,
+    is_commit_by_any_author,
+)
+from evaluator.utils.data_loader import (
+    load_commits_from_local,
+    iter_commits_from_local,
+    load_commits_list_cached,
+    iter_json_array,
+)
 
 __all__ = [
     "parse_repo_url",
     "parse_github_url",
     "get_author_from_commit",
+    "get_commit_author_key",
     "is_commit_by_author",
+    "is_commit_by_any_author",
     "load_commits_from_local",
+    "iter_commits_from_local",
+    "load_commits_list_cached",
+    "iter_json_array",
 ]
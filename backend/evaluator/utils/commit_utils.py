@@ -1,6 +1,6 @@
 """Commit data utility functions."""
 
-from typing import Dict, Any, Optional
+from typing import AbstractSet, Dict, Any, Optional
 
 
 def get_author_from_commit(commit_data: Dict[str, Any]) -> Optional[str]:
@@ -38,16 +38,33 @@ def get_author_from_commit(commit_data: Dict[str, Any]) -> Optional[str]:
     return None
 
 
-def is_commit_by_author(commit: Dict[str, Any], username: str) -> bool:
-    """Check if commit is by the specified author"""
+def get_commit_author_key(commit: Dict[str, Any]) -> Optional[str]:
+    """Lowercased author name used for author matching (None if the commit has none)."""
     # Try custom extraction format first
     if "author" in commit and isinstance(commit["author"], str):
-        return commit["author"].lower() == username.lower()
+        return commit["author"].lower()
 
     # Try GitHub API format
     if "commit" in commit:
         author = commit.get("commit", {}).get("author", {}).get("name", "")
         if author:
-            return author.lower() == username.lower()
+            return author.lower()
+
+    return None
+
+
+def is_commit_by_author(commit: Dict[str, Any], username: str) -> bool:
+    """Check if commit is by the specified author"""
+    key = get_commit_author_key(commit)
+    return key is not None and key == username.lower()
+
 
-    return False
+def is_commit_by_any_author(commit: Dict[str, Any], authors: AbstractSet[str]) -> bool:
+    """
+    Check if commit is by any of the given authors.
+
+    `authors` must already be lowercased; build it once (e.g. a frozenset) per analysis
+    so each commit costs one name extraction and one hash lookup.
+    """
+    key = get_commit_author_key(commit)
+    return key is not None and key in authors
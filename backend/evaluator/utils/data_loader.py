@@ -1,33 +1,38 @@
 """Data loading utilities for local commit data."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List, Tuple
 
+_JSON_WHITESPACE = ' \t\n\r'
+_JSON_DELIMITERS = ',]' + _JSON_WHITESPACE
 
-def load_commits_from_local(data_dir: Path, limit: int = None) -> List[Dict[str, Any]]:
+
+def iter_commits_from_local(data_dir: Path, limit: int = None) -> Iterator[Dict[str, Any]]:
     """
-    Load commits from local extracted data
+    Lazily yield commits from local extracted data, in commits_index order (newest first)
+
+    Commit detail files are only read as the caller advances, so a caller that stops
+    early (e.g. at an already-synced SHA) skips loading the rest.
 
     Args:
         data_dir: Path to data directory (e.g., data/owner/repo)
         limit: Maximum commits to load (None = all commits)
 
-    Returns:
-        List of commit data
+    Yields:
+        Commit data
     """
     commits_index_path = data_dir / "commits_index.json"
 
-    if not commits_index_path.exists():
+    # Load commits index (bytes straight into json.loads, no text-layer decode)
+    try:
+        with open(commits_index_path, 'rb') as f:
+            commits_index = json.loads(f.read())
+    except FileNotFoundError:
         print(f"[Warning] Commits index not found: {commits_index_path}")
-        return []
+        return
 
-    # Load commits index
-    with open(commits_index_path, 'r', encoding='utf-8') as f:
-        commits_index = json.load(f)
-
-    # Load detailed commit data
-    commits = []
     commits_dir = data_dir / "commits"
 
     # Apply limit if specified
@@ -39,16 +44,127 @@ def load_commits_from_local(data_dir: Path, limit: int = None) -> List[Dict[str,
         if not commit_sha:
             continue
 
-        # Try to load commit JSON
+        # Try to load commit JSON (missing detail files are skipped silently)
         commit_json_path = commits_dir / f"{commit_sha}.json"
 
-        if commit_json_path.exists():
-            try:
-                with open(commit_json_path, 'r', encoding='utf-8') as f:
-                    commit_data = json.load(f)
-                    commits.append(commit_data)
-            except Exception as e:
-                print(f"[Warning] Failed to load {commit_sha}: {e}")
+        try:
+            with open(commit_json_path, 'rb') as f:
+                commit = json.loads(f.read())
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"[Warning] Failed to load {commit_sha}: {e}")
+            continue
+        yield commit
+
+
+def load_commits_from_local(data_dir: Path, limit: int = None) -> List[Dict[str, Any]]:
+    """
+    Load commits from local extracted data
 
+    Args:
+        data_dir: Path to data directory (e.g., data/owner/repo)
+        limit: Maximum commits to load (None = all commits)
+
+    Returns:
+        List of commit data
+    """
+    commits = list(iter_commits_from_local(data_dir, limit=limit))
     print(f"[Info] Loaded {len(commits)} commit details")
     return commits
+
+
+@lru_cache(maxsize=16)
+def _parse_commits_list(path_str: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], ...]:
+    # mtime/size only key the cache so a rewritten file is parsed again
+    with open(path_str, 'rb') as f:
+        return tuple(json.loads(f.read()))
+
+
+def load_commits_list_cached(path: Path) -> Tuple[Dict[str, Any], ...]:
+    """
+    Load a commits_list.json, reusing the parsed result while the file is unchanged
+
+    The cache is keyed by (path, mtime, size). The returned tuple and its commit
+    dicts are shared between callers and must not be mutated.
+
+    Args:
+        path: Path to commits_list.json
+
+    Returns:
+        Tuple of commits (newest first)
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If it isn't valid JSON
+    """
+    st = path.stat()
+    return _parse_commits_list(str(path), st.st_mtime_ns, st.st_size)
+
+
+def iter_json_array(path: Path, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """
+    Stream the elements of a top-level JSON array file one at a time.
+
+    Only the current element plus one read chunk are held in memory, instead of
+    the whole parsed list (json.load). Elements are decoded with the stdlib decoder.
+
+    Args:
+        path: Path to a file containing a JSON array (e.g. commits_list.json)
+        chunk_size: Characters to read per chunk
+
+    Yields:
+        Each array element
+
+    Raises:
+        ValueError: If the file is not a well-formed JSON array
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = ''
+        pos = 0
+        eof = False
+        state = 'start'  # start -> first (after '[') -> sep <-> value
+
+        while True:
+            while pos < len(buf) and buf[pos] in _JSON_WHITESPACE:
+                pos += 1
+            if pos == len(buf):
+                if eof:
+                    raise ValueError(f"Unexpected end of JSON array in {path}")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+
+            ch = buf[pos]
+            if state == 'start':
+                if ch != '[':
+                    raise ValueError(f"Expected a JSON array in {path}")
+                pos += 1
+                state = 'first'
+            elif state == 'sep' or (state == 'first' and ch == ']'):
+                if ch == ']':
+                    return
+                if ch != ',':
+                    raise ValueError(f"Expected ',' or ']' at offset {pos} in {path}")
+                pos += 1
+                state = 'value'
+            else:
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                    # A number cut by the chunk boundary can still decode ("1.5" of "1.5e3"),
+                    # so only accept a value once the delimiter after it has been read
+                    complete = eof or (end < len(buf) and buf[end] in _JSON_DELIMITERS)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    complete = False
+                if not complete:
+                    chunk = f.read(chunk_size)
+                    eof = not chunk
+                    buf, pos = buf[pos:] + chunk, 0
+                    continue
+                pos = end
+                state = 'sep'
+                yield item
@@ -1,8 +1,20 @@
 """Repository URL parsing utilities."""
 
 import re
+from functools import lru_cache
 from typing import Optional, Dict, Tuple
 
+# Compiled once at import; tried in order
+_GITHUB_PATTERNS = tuple(re.compile(p) for p in (
+    r'^https?://(?:www\.)?github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+    r'^github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+    r'^git@github\.com:([^/]+)/([^/\s]+?)(?:\.git)?$',
+))
+_GITEE_PATTERNS = tuple(re.compile(p) for p in (
+    r'^https?://(?:www\.)?gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+    r'^gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+))
+
 
 def parse_github_url(url: str) -> Optional[Dict[str, str]]:
     """
@@ -16,14 +28,8 @@ def parse_github_url(url: str) -> Optional[Dict[str, str]]:
     url = url.strip()
 
     # Try different patterns
-    patterns = [
-        r'^https?://(?:www\.)?github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-        r'^github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-        r'^git@github\.com:([^/]+)/([^/\s]+?)(?:\.git)?$',
-    ]
-
-    for pattern in patterns:
-        match = re.match(pattern, url)
+    for pattern in _GITHUB_PATTERNS:
+        match = pattern.match(url)
         if match:
             owner, repo = match.groups()
             # Remove .git suffix if present
@@ -33,10 +39,14 @@ def parse_github_url(url: str) -> Optional[Dict[str, str]]:
     return None
 
 
+@lru_cache(maxsize=1024)
 def parse_repo_url(url: str) -> Optional[Tuple[str, str, str]]:
     """
     Parse repository URL and return (platform, owner, repo).
 
+    Results are memoized (the returned tuple is immutable); the same URLs are
+    parsed repeatedly across routes.
+
     Supports:
     - GitHub: https://github.com/owner/repo, github.com/owner/repo, git@github.com:owner/repo(.git)
     - Gitee:  https://gitee.com/owner/repo(.git)
@@ -45,19 +55,18 @@ def parse_repo_url(url: str) -> Optional[Tuple[str, str, str]]:
     if not url:
         return None
 
-    parsed = parse_github_url(url)
-    if parsed:
-        return ("github", parsed["owner"], parsed["repo"])
+    # Every pattern contains its host name literally; skip hosts the URL doesn't mention
+    if "github" in url:
+        parsed = parse_github_url(url)
+        if parsed:
+            return ("github", parsed["owner"], parsed["repo"])
 
-    patterns = [
-        r'^https?://(?:www\.)?gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-        r'^gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-    ]
-    for pattern in patterns:
-        match = re.match(pattern, url)
-        if match:
-            owner, repo = match.groups()
-            repo = repo.replace('.git', '')
-            return ("gitee", owner, repo)
+    if "gitee" in url:
+        for pattern in _GITEE_PATTERNS:
+            match = pattern.match(url)
+            if match:
+                owner, repo = match.groups()
+                repo = repo.replace('.git', '')
+                return ("gitee", owner, repo)
 
     return None
@@ -3,8 +3,9 @@ API routes for Repository Runner
 """
 
 import asyncio
+import contextlib
 import json
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Tuple
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from repos_runner.schemas import (
@@ -21,6 +22,49 @@ from repos_runner.services import (
 
 router = APIRouter(prefix="/api/runner")
 
+# Max progress messages buffered per stream before the producer waits for the client
+PROGRESS_QUEUE_SIZE = 256
+# Max queued events coalesced into one response chunk
+MAX_EVENTS_PER_CHUNK = 64
+
+# Progress events only vary by message; same bytes json.dumps gives for the full envelope
+_PROGRESS_EVENT_PREFIX = b'data: {"event": "progress", "data": {"message": '
+_PROGRESS_EVENT_SUFFIX = b'}}\n\n'
+
+
+def _sse_event(message) -> bytes:
+    """Format a queued progress message (str) or status update (dict) as an SSE event."""
+    if isinstance(message, str):
+        # Progress message: only the string itself needs encoding (json.dumps escapes
+        # non-ASCII, so the ascii codec is enough)
+        return _PROGRESS_EVENT_PREFIX + json.dumps(message).encode('ascii') + _PROGRESS_EVENT_SUFFIX
+
+    # Status update (completed/failed)
+    event_data = json.dumps({
+        "event": "status",
+        "data": message
+    })
+    return f"data: {event_data}\n\n".encode('ascii')
+
+
+def _drain_events(progress_queue: asyncio.Queue, message) -> Tuple[bytes, bool]:
+    """
+    Encode message plus whatever else is already queued as one SSE chunk.
+
+    Messages that piled up while the previous chunk was being sent go out in a
+    single write; nothing waits for more. The None completion signal ends the batch.
+
+    Returns:
+        Tuple of (chunk bytes, whether the stream is finished)
+    """
+    events = []
+    while message is not None:
+        events.append(_sse_event(message))
+        if len(events) >= MAX_EVENTS_PER_CHUNK or progress_queue.empty():
+            return b"".join(events), False
+        message = progress_queue.get_nowait()
+    return b"".join(events), True
+
 
 @router.post("/clone")
 async def clone_repo(request: RepoCloneRequest):
@@ -51,9 +95,10 @@ async def explore_repo_stream(clone_path: str):
     Returns:
         Server-Sent Events stream with progress updates
     """
-    async def event_generator() -> AsyncGenerator[str, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         """Generate SSE events for progress updates"""
-        progress_queue = asyncio.Queue()
+        # Bounded: a slow client throttles the producer instead of growing the queue
+        progress_queue = asyncio.Queue(maxsize=PROGRESS_QUEUE_SIZE)
 
         async def progress_callback(message: str):
             """Callback to send progress updates"""
@@ -63,38 +108,35 @@ async def explore_repo_stream(clone_path: str):
         async def explore_task():
             try:
                 result = await explore_repository(clone_path, progress_callback)
-                await progress_queue.put({"status": "completed", "overview_path": result})
+                status = {"status": "completed", "overview_path": result}
             except Exception as e:
-                await progress_queue.put({"status": "failed", "error": str(e)})
-            finally:
-                await progress_queue.put(None)  # Signal completion
+                status = {"status": "failed", "error": str(e)}
+            # Not in a finally: a task cancelled after the client disconnected must not
+            # block on the bounded queue that nobody drains any more
+            await progress_queue.put(status)
+            await progress_queue.put(None)  # Signal completion
 
         # Run exploration in background
         task = asyncio.create_task(explore_task())
 
         # Stream progress updates
-        while True:
-            message = await progress_queue.get()
-
-            if message is None:
-                break
-
-            if isinstance(message, str):
-                # Progress message
-                event_data = json.dumps({
-                    "event": "progress",
-                    "data": {"message": message}
-                })
-            else:
-                # Status update (completed/failed)
-                event_data = json.dumps({
-                    "event": "status",
-                    "data": message
-                })
-
-            yield f"data: {event_data}\n\n"
-
-        await task
+        try:
+            while True:
+                message = await progress_queue.get()
+
+                chunk, finished = _drain_events(progress_queue, message)
+                if chunk:
+                    yield chunk
+                if finished:
+                    break
+        finally:
+            # The task finishes right after queuing None. If it's still running, the
+            # stream was closed early (client disconnected) and nothing will drain the
+            # bounded queue, so stop the task instead of leaving it blocked on put()
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
 
     return StreamingResponse(
         event_generator(),
@@ -136,9 +178,10 @@ async def run_tests_stream(clone_path: str, overview_path: str):
     Returns:
         Server-Sent Events stream with test progress and results
     """
-    async def event_generator() -> AsyncGenerator[str, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         """Generate SSE events for test progress"""
-        progress_queue = asyncio.Queue()
+        # Bounded: a slow client throttles the producer instead of growing the queue
+        progress_queue = asyncio.Queue(maxsize=PROGRESS_QUEUE_SIZE)
 
         async def progress_callback(message: str):
             """Callback to send progress updates"""
@@ -148,38 +191,35 @@ async def run_tests_stream(clone_path: str, overview_path: str):
         async def test_task():
             try:
                 result = await run_tests(clone_path, overview_path, progress_callback)
-                await progress_queue.put({"status": "completed", "results": result})
+                status = {"status": "completed", "results": result}
             except Exception as e:
-                await progress_queue.put({"status": "failed", "error": str(e)})
-            finally:
-                await progress_queue.put(None)  # Signal completion
+                status = {"status": "failed", "error": str(e)}
+            # Not in a finally: a task cancelled after the client disconnected must not
+            # block on the bounded queue that nobody drains any more
+            await progress_queue.put(status)
+            await progress_queue.put(None)  # Signal completion
 
         # Run tests in background
         task = asyncio.create_task(test_task())
 
         # Stream progress updates
-        while True:
-            message = await progress_queue.get()
-
-            if message is None:
-                break
-
-            if isinstance(message, str):
-                # Progress message
-                event_data = json.dumps({
-                    "event": "progress",
-                    "data": {"message": message}
-                })
-            else:
-                # Status update (completed/failed)
-                event_data = json.dumps({
-                    "event": "status",
-                    "data": message
-                })
-
-            yield f"data: {event_data}\n\n"
-
-        await task
+        try:
+            while True:
+                message = await progress_queue.get()
+
+                chunk, finished = _drain_events(progress_queue, message)
+                if chunk:
+                    yield chunk
+                if finished:
+                    break
+        finally:
+            # The task finishes right after queuing None. If it's still running, the
+            # stream was closed early (client disconnected) and nothing will drain the
+            # bounded queue, so stop the task instead of leaving it blocked on put()
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
 
     return StreamingResponse(
         event_generator(),
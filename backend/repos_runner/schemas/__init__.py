@@ -2,7 +2,7 @@
 Pydantic schemas for Repository Runner
 """
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
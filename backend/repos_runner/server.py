@@ -9,8 +9,7 @@ import sys
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 from dotenv import load_dotenv
 
 # Add backend directory to Python path to allow 'repos_runner' imports
@@ -28,12 +27,18 @@ load_dotenv(override=False)
 app = FastAPI(title="Repository Runner API")
 
 # Middleware to strip trailing slashes from API requests
-class TrailingSlashMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path != "/" and request.url.path.endswith("/"):
-            new_path = request.url.path.rstrip("/")
-            request.scope["path"] = new_path
-        return await call_next(request)
+# Plain ASGI rather than BaseHTTPMiddleware: no extra task/stream wrapping per request,
+# which matters for the long-lived SSE responses
+class TrailingSlashMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path != "/" and path.endswith("/"):
+                scope = dict(scope, path=path.rstrip("/") or "/")
+        await self.app(scope, receive, send)
 
 app.add_middleware(TrailingSlashMiddleware)
 
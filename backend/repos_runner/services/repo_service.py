@@ -6,11 +6,14 @@ import os
 import subprocess
 import shutil
 from pathlib import Path
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, List
 import git
 import json
 import asyncio
+import re
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 
 
 def get_repos_dir() -> Path:
@@ -54,10 +57,13 @@ def ensure_repo_venv(clone_path: str) -> Path:
     return python_path
 
 
+@lru_cache(maxsize=256)
 def parse_repo_url(repo_url: str) -> Tuple[str, str, str]:
     """
     Parse repository URL to extract platform, owner, and repo name.
 
+    Memoized like the evaluator's URL parsers (the result tuple is immutable).
+
     Returns:
         Tuple of (platform, owner, repo_name)
     """
@@ -78,6 +84,28 @@ def parse_repo_url(repo_url: str) -> Tuple[str, str, str]:
         raise ValueError(f"Unsupported repository URL: {repo_url}")
 
 
+async def _fast_rmtree(path: Path) -> None:
+    """
+    Remove a directory tree without blocking the event loop.
+
+    On POSIX this shells out to `rm -rf`, which walks large trees (node_modules,
+    .git packs) much faster than shutil.rmtree's per-entry Python loop. Windows, or a
+    failed `rm`, falls back to shutil.rmtree in a worker thread.
+    """
+    if os.name != 'nt':
+        proc = await asyncio.create_subprocess_exec(
+            "rm", "-rf", "--", str(path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        await proc.wait()
+    # `rm` may fail part-way (or the tree may be removed concurrently); only fall back
+    # for what is left, so a missing path doesn't raise
+    if not path.exists():
+        return
+    await asyncio.to_thread(shutil.rmtree, path)
+
+
 async def clone_repository(repo_url: str) -> Dict[str, Any]:
     """
     Clone a repository with depth 1 (shallow clone).
@@ -96,7 +124,7 @@ async def clone_repository(repo_url: str) -> Dict[str, Any]:
 
     # Remove existing directory if it exists
     if clone_path.exists():
-        shutil.rmtree(clone_path)
+        await _fast_rmtree(clone_path)
 
     # Clone the repository (shallow clone)
     try:
@@ -228,6 +256,35 @@ Generate the markdown content for REPO_OVERVIEW.md:"""
         raise Exception(f"Failed to explore repository: {str(e)}")
 
 
+# Directories never worth listing (or descending into) in the repo overview
+_LISTING_SKIP_DIRS = frozenset({".git", "node_modules", "venv", ".venv", "__pycache__"})
+
+
+def _list_repo_files(root: Path, limit: int = 100) -> List[str]:
+    """
+    List up to `limit` entries (files and directories) under root, relative to it.
+
+    Walks breadth-first with os.scandir, so top-level entries come first, skipped
+    directories are never descended into, and the walk stops once `limit` is reached.
+    """
+    entries = []
+    pending = deque([str(root)])
+    while pending and len(entries) < limit:
+        try:
+            with os.scandir(pending.popleft()) as it:
+                for entry in it:
+                    if entry.name in _LISTING_SKIP_DIRS:
+                        continue
+                    entries.append(os.path.relpath(entry.path, root))
+                    if len(entries) >= limit:
+                        break
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            continue
+    return entries
+
+
 async def _build_repo_context(repo_path: Path, progress_callback=None) -> str:
     """Build context about the repository for Claude to analyze"""
     context_parts = []
@@ -257,13 +314,7 @@ async def _build_repo_context(repo_path: Path, progress_callback=None) -> str:
     except Exception:
         # Fallback to simple listing
         try:
-            files = []
-            for item in repo_path.rglob("*"):
-                if any(skip in str(item) for skip in [".git", "node_modules", "venv", "__pycache__"]):
-                    continue
-                rel_path = item.relative_to(repo_path)
-                if len(files) < 100:
-                    files.append(str(rel_path))
+            files = _list_repo_files(repo_path, limit=100)
             context_parts.append(f"## Files:\n" + "\n".join(files))
         except Exception:
             pass
@@ -344,7 +395,6 @@ If no tests are found, return {{"test_commands": [], "setup_commands": []}}
         # Parse response
         response_text = message.content[0].text
         # Extract JSON from response
-        import re
         json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
         if json_match:
             test_info = json.loads(json_match.group())
@@ -367,7 +417,6 @@ async def _generate_test_report(
     test_results: list
 ) -> None:
     """Generate TEST_REPORT.md for analyzed repository"""
-    from datetime import datetime
 
     # Calculate percentages
     pass_rate = (passed / total * 100) if total > 0 else 0
@@ -511,78 +560,107 @@ This repository does not appear to have any automated tests configured. Consider
     report_path.write_text(report)
 
 
+# Test summary formats tried in order by _parse_test_output_with_regex (compiled once)
+_JEST_RE = re.compile(r'Tests:\s+(\d+)\s+failed,\s+(\d+)\s+passed,\s+(\d+)\s+total')
+_JEST_PASSED_RE = re.compile(r'Tests:\s+(\d+)\s+passed,\s+(\d+)\s+total')
+_JEST_FAILED_RE = re.compile(r'Tests:\s+(\d+)\s+failed,\s+(\d+)\s+total')
+_PYTEST_RE = re.compile(r'=+\s*(\d+)\s+failed,\s+(\d+)\s+passed')
+_PYTEST_PASSED_RE = re.compile(r'=+\s*(\d+)\s+passed')
+_GO_RE = re.compile(r'FAIL:\s*(\d+).*PASS:\s*(\d+)')
+
+
+# Summary lines are printed last; scan this many trailing characters before the full output
+_SUMMARY_TAIL_CHARS = 8192
+
+
 def _parse_test_output_with_regex(output: str) -> Optional[Dict[str, int]]:
     """
     Try to parse test output using regex patterns for common formats.
     This is the fast path for well-known test frameworks.
 
+    Only the tail of the output is scanned first, since test frameworks print their
+    summary at the end; the full output is only searched if the tail has no match
+    (e.g. the summary is followed by a lot of stderr).
+
     Returns:
         Dictionary with 'passed', 'failed', 'total' keys, or None if no match
     """
-    import re
-
-    # Jest format: "Tests:       9 failed, 9 passed, 18 total"
-    jest_match = re.search(r'Tests:\s+(\d+)\s+failed,\s+(\d+)\s+passed,\s+(\d+)\s+total', output)
-    if jest_match:
-        return {
-            'failed': int(jest_match.group(1)),
-            'passed': int(jest_match.group(2)),
-            'total': int(jest_match.group(3))
-        }
-
-    # Jest format (all passed): "Tests:       9 passed, 18 total"
-    jest_passed_match = re.search(r'Tests:\s+(\d+)\s+passed,\s+(\d+)\s+total', output)
-    if jest_passed_match:
-        passed = int(jest_passed_match.group(1))
-        total = int(jest_passed_match.group(2))
-        return {
-            'passed': passed,
-            'failed': total - passed,
-            'total': total
-        }
-
-    # Jest format (all failed): "Tests:       9 failed, 18 total"
-    jest_failed_match = re.search(r'Tests:\s+(\d+)\s+failed,\s+(\d+)\s+total', output)
-    if jest_failed_match:
-        failed = int(jest_failed_match.group(1))
-        total = int(jest_failed_match.group(2))
-        return {
-            'passed': total - failed,
-            'failed': failed,
-            'total': total
-        }
-
-    # pytest format: "====== 9 failed, 9 passed in 8.51s ======"
-    pytest_match = re.search(r'=+\s*(\d+)\s+failed,\s+(\d+)\s+passed', output)
-    if pytest_match:
-        failed = int(pytest_match.group(1))
-        passed = int(pytest_match.group(2))
-        return {
-            'failed': failed,
-            'passed': passed,
-            'total': failed + passed
-        }
-
-    # pytest format (all passed): "====== 9 passed in 8.51s ======"
-    pytest_passed_match = re.search(r'=+\s*(\d+)\s+passed', output)
-    if pytest_passed_match:
-        passed = int(pytest_passed_match.group(1))
-        return {
-            'passed': passed,
-            'failed': 0,
-            'total': passed
-        }
-
-    # Go test format: "FAIL: 9 PASS: 9"
-    go_match = re.search(r'FAIL:\s*(\d+).*PASS:\s*(\d+)', output)
-    if go_match:
-        failed = int(go_match.group(1))
-        passed = int(go_match.group(2))
-        return {
-            'failed': failed,
-            'passed': passed,
-            'total': failed + passed
-        }
+    if len(output) > _SUMMARY_TAIL_CHARS:
+        result = _match_test_summary(output[-_SUMMARY_TAIL_CHARS:])
+        if result:
+            return result
+    return _match_test_summary(output)
+
+
+def _match_test_summary(output: str) -> Optional[Dict[str, int]]:
+    """Match the known test summary formats against output, in priority order."""
+    # Each family's patterns contain a literal marker; a C-level substring check skips
+    # the regex scans for frameworks that didn't produce the output
+    if "Tests:" in output:
+        # Jest format: "Tests:       9 failed, 9 passed, 18 total"
+        jest_match = _JEST_RE.search(output)
+        if jest_match:
+            return {
+                'failed': int(jest_match.group(1)),
+                'passed': int(jest_match.group(2)),
+                'total': int(jest_match.group(3))
+            }
+
+        # Jest format (all passed): "Tests:       9 passed, 18 total"
+        jest_passed_match = _JEST_PASSED_RE.search(output)
+        if jest_passed_match:
+            passed = int(jest_passed_match.group(1))
+            total = int(jest_passed_match.group(2))
+            return {
+                'passed': passed,
+                'failed': total - passed,
+                'total': total
+            }
+
+        # Jest format (all failed): "Tests:       9 failed, 18 total"
+        jest_failed_match = _JEST_FAILED_RE.search(output)
+        if jest_failed_match:
+            failed = int(jest_failed_match.group(1))
+            total = int(jest_failed_match.group(2))
+            return {
+                'passed': total - failed,
+                'failed': failed,
+                'total': total
+            }
+
+    if "passed" in output and "=" in output:
+        # pytest format: "====== 9 failed, 9 passed in 8.51s ======"
+        pytest_match = _PYTEST_RE.search(output)
+        if pytest_match:
+            failed = int(pytest_match.group(1))
+            passed = int(pytest_match.group(2))
+            return {
+                'failed': failed,
+                'passed': passed,
+                'total': failed + passed
+            }
+
+        # pytest format (all passed): "====== 9 passed in 8.51s ======"
+        pytest_passed_match = _PYTEST_PASSED_RE.search(output)
+        if pytest_passed_match:
+            passed = int(pytest_passed_match.group(1))
+            return {
+                'passed': passed,
+                'failed': 0,
+                'total': passed
+            }
+
+    if "FAIL:" in output and "PASS:" in output:
+        # Go test format: "FAIL: 9 PASS: 9"
+        go_match = _GO_RE.search(output)
+        if go_match:
+            failed = int(go_match.group(1))
+            passed = int(go_match.group(2))
+            return {
+                'failed': failed,
+                'passed': passed,
+                'total': failed + passed
+            }
 
     # No match found
     return None
@@ -647,7 +725,6 @@ If you cannot determine the counts, return: {{"passed": 0, "failed": 0, "total":
         # Parse response
         response_text = message.content[0].text.strip()
         # Extract JSON from response
-        import re
         json_match = re.search(r'\{[^}]+\}', response_text)
         if json_match:
             result = json.loads(json_match.group())
@@ -681,6 +758,38 @@ async def _parse_test_output(output: str) -> Optional[Dict[str, int]]:
     return result
 
 
+async def _run_shell(cmd: str, cwd: Path, timeout: float) -> Tuple[int, str, str]:
+    """
+    Run a shell command without blocking the event loop.
+
+    Args:
+        cmd: Shell command line
+        cwd: Working directory
+        timeout: Seconds before the command is killed
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+
+    Raises:
+        asyncio.TimeoutError: If the command ran longer than timeout
+    """
+    proc = await asyncio.create_subprocess_shell(
+        cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        # Don't leave the command running after a timeout or a cancelled stream
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
 async def run_tests(clone_path: str, overview_path: str, progress_callback=None) -> Dict[str, Any]:
     """
     Identify and run tests based on REPO_OVERVIEW.md.
@@ -754,7 +863,6 @@ If no tests are found, return {{"test_commands": [], "setup_commands": []}}
         # Parse response
         response_text = message.content[0].text
         # Extract JSON from response
-        import re
         json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
         if json_match:
             test_info = json.loads(json_match.group())
@@ -768,8 +876,8 @@ If no tests are found, return {{"test_commands": [], "setup_commands": []}}
 
     # Run setup commands if any
     if test_info.get("setup_commands"):
-        # Ensure per-repository virtual environment exists
-        venv_python = ensure_repo_venv(clone_path)
+        # Ensure per-repository virtual environment exists (venv + pip bootstrap blocks)
+        venv_python = await asyncio.to_thread(ensure_repo_venv, clone_path)
 
         for cmd in test_info["setup_commands"]:
             if progress_callback:
@@ -782,16 +890,9 @@ If no tests are found, return {{"test_commands": [], "setup_commands": []}}
                 cmd = cmd.replace("pip3 install", f"{venv_python} -m pip install")
 
             try:
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    cwd=clone_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
-                if progress_callback and result.returncode != 0:
-                    await progress_callback(f"Setup warning: {result.stderr[:200]}")
+                returncode, _, stderr = await _run_shell(cmd, cwd=clone_dir, timeout=300)
+                if progress_callback and returncode != 0:
+                    await progress_callback(f"Setup warning: {stderr[:200]}")
             except Exception as e:
                 if progress_callback:
                     await progress_callback(f"Setup failed: {str(e)}")
@@ -836,8 +937,10 @@ If no tests are found, return {{"test_commands": [], "setup_commands": []}}
     total_tests = 0
 
     # Get per-repository venv python path for running tests
-    venv_python = ensure_repo_venv(clone_path)
+    venv_python = await asyncio.to_thread(ensure_repo_venv, clone_path)
 
+    # Commands run one after another: they share the checkout, venv and caches, and
+    # e.g. a build step may be listed before the tests that need it
     for idx, cmd in enumerate(test_info.get("test_commands", [])):
         if progress_callback:
             await progress_callback(f"Running test {idx + 1}/{num_commands}: {cmd}")
@@ -852,17 +955,10 @@ If no tests are found, return {{"test_commands": [], "setup_commands": []}}
 
         start_time = datetime.now()
         try:
-            result = subprocess.run(
-                modified_cmd,
-                shell=True,
-                cwd=clone_dir,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+            returncode, stdout, stderr = await _run_shell(modified_cmd, cwd=clone_dir, timeout=300)
 
             duration = (datetime.now() - start_time).total_seconds()
-            output = result.stdout + result.stderr
+            output = stdout + stderr
 
             # Try to parse test output to get actual test counts
             parsed_counts = await _parse_test_output(output)
@@ -875,7 +971,7 @@ If no tests are found, return {{"test_commands": [], "setup_commands": []}}
                 status = "passed" if cmd_failed == 0 else "failed"
             else:
                 # Fallback: treat command as single test
-                status = "passed" if result.returncode == 0 else "failed"
+                status = "passed" if returncode == 0 else "failed"
                 cmd_passed = 1 if status == "passed" else 0
                 cmd_failed = 1 if status == "failed" else 0
                 cmd_total = 1
@@ -898,7 +994,7 @@ If no tests are found, return {{"test_commands": [], "setup_commands": []}}
                 else:
                     await progress_callback(f"Test {idx + 1} {status}")
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             test_results.append({
                 "name": cmd,
                 "status": "failed",
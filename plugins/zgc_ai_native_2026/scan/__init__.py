@@ -276,8 +276,9 @@ class CommitEvaluatorModerate:
             print(f"[Parallel] Chunk {idx}/{len(chunks)} completed")
             return idx, chunk_scores, chunk_files
 
-        # Execute chunks in parallel
-        with ThreadPoolExecutor(max_workers=self.max_parallel_workers) as executor:
+        # Execute chunks in parallel (no more threads than chunks)
+        max_workers = max(1, min(self.max_parallel_workers, len(chunks)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
                 executor.submit(evaluate_single_chunk, idx, chunk): idx
                 for idx, chunk in enumerate(chunks, 1)
@@ -290,6 +291,9 @@ class CommitEvaluatorModerate:
                     all_files.update(files)
                 except Exception as e:
                     print(f"[Parallel] Chunk evaluation failed: {e}")
+                    # Don't spend LLM calls on chunks whose result will be discarded
+                    for pending in futures:
+                        pending.cancel()
                     raise
 
         # Sort results by chunk index
@@ -0,0 +1,71 @@
+"""Test cases for benchmark routes."""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path if not already there
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Add backend directory to Python path so evaluator can be imported as top-level package
+backend_dir = project_root / "backend"
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from evaluator.routes import benchmark
+from evaluator.routes.benchmark import evaluation_function_wrapper
+
+
+class TestEvaluationFunctionWrapper:
+    """Test coalescing of identical in-flight benchmark evaluations."""
+
+    def test_concurrent_calls_share_one_evaluation(self):
+        """Identical concurrent calls run the evaluation once."""
+        calls = []
+
+        async def fake_evaluate(repo_url, author, plugin_id, model):
+            calls.append(author)
+            await asyncio.sleep(0.01)
+            return {"overall_score": 80}
+
+        async def run():
+            return await asyncio.gather(
+                evaluation_function_wrapper("https://github.com/o/r", "alice"),
+                evaluation_function_wrapper("https://github.com/o/r", "alice"),
+            )
+
+        with patch.object(benchmark, "_evaluate_repo_author", fake_evaluate):
+            results = asyncio.run(run())
+
+        assert results == [{"overall_score": 80}, {"overall_score": 80}]
+        assert calls == ["alice"]
+        assert benchmark._inflight == {}
+
+    def test_cancelled_first_caller_does_not_cancel_waiters(self):
+        """Cancelling the caller that started the evaluation still delivers the result to the others."""
+        started = None
+
+        async def fake_evaluate(repo_url, author, plugin_id, model):
+            started.set()
+            await asyncio.sleep(0.01)
+            return {"overall_score": 80}
+
+        async def run():
+            nonlocal started
+            started = asyncio.Event()
+            first = asyncio.ensure_future(evaluation_function_wrapper("https://github.com/o/r", "alice"))
+            await started.wait()
+            second = asyncio.ensure_future(evaluation_function_wrapper("https://github.com/o/r", "alice"))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second, first
+
+        with patch.object(benchmark, "_evaluate_repo_author", fake_evaluate):
+            result, first = asyncio.run(run())
+
+        assert result == {"overall_score": 80}
+        assert first.cancelled()
+        assert benchmark._inflight == {}
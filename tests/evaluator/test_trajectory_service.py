@@ -107,6 +107,80 @@ class TestTrajectoryCache:
                 saved_data = json.load(f)
             assert saved_data["username"] == "test_user"
 
+    def test_load_trajectory_cache_reuses_parsed_until_saved(self, temp_cache_dir):
+        """Test unchanged cache files are served from memory and saves invalidate them."""
+        from evaluator.schemas.trajectory import TrajectoryCache
+
+        cache_file = temp_cache_dir / "test_user.json"
+        trajectory = TrajectoryCache(username="test_user", repo_urls=["https://github.com/test/repo"])
+
+        with patch('evaluator.services.trajectory_service.get_trajectory_cache_path') as mock_path:
+            mock_path.return_value = cache_file
+
+            save_trajectory_cache(trajectory)
+            first = load_trajectory_cache("test_user")
+            assert load_trajectory_cache("test_user") is first
+
+            trajectory.repo_urls = ["https://github.com/test/other"]
+            save_trajectory_cache(trajectory)
+            reloaded = load_trajectory_cache("test_user")
+
+            assert reloaded is not first
+            assert reloaded.repo_urls == ["https://github.com/test/other"]
+
+    def test_save_trajectory_cache_appends_new_checkpoints(self, temp_cache_dir):
+        """Test incremental saves append only new checkpoints to the log."""
+        from evaluator.schemas.trajectory import TrajectoryCache, TrajectoryCheckpoint
+
+        def make_checkpoint(checkpoint_id):
+            return TrajectoryCheckpoint(
+                checkpoint_id=checkpoint_id,
+                created_at="2024-01-01T00:00:00",
+                commits_range={"start_sha": "a", "end_sha": f"sha{checkpoint_id}", "commit_count": 10},
+                evaluation={
+                    "username": "test_user",
+                    "total_commits_analyzed": 10,
+                    "scores": {"reasoning": ""},
+                    "commits_summary": {},
+                    "evaluated_at": "2024-01-01T00:00:00",
+                    "plugin": "test",
+                    "plugin_version": "0.1.0",
+                },
+            )
+
+        cache_file = temp_cache_dir / "test_user.json"
+        log_file = temp_cache_dir / "test_user.checkpoints.jsonl"
+        trajectory = TrajectoryCache(
+            username="test_user",
+            repo_urls=["https://github.com/test/repo"],
+            checkpoints=[make_checkpoint(1)],
+            total_checkpoints=1
+        )
+
+        with patch('evaluator.services.trajectory_service.get_trajectory_cache_path') as mock_path:
+            mock_path.return_value = cache_file
+
+            # Full save, then an incremental one moves the existing checkpoint into the log
+            save_trajectory_cache(trajectory)
+            assert not log_file.exists()
+            save_trajectory_cache(trajectory, persisted_checkpoints=1)
+            assert len(log_file.read_text(encoding='utf-8').splitlines()) == 1
+            assert "checkpoints" not in json.loads(cache_file.read_text(encoding='utf-8'))
+
+            trajectory.checkpoints.append(make_checkpoint(2))
+            trajectory.total_checkpoints = 2
+            save_trajectory_cache(trajectory, persisted_checkpoints=1)
+            assert len(log_file.read_text(encoding='utf-8').splitlines()) == 2
+
+            loaded = load_trajectory_cache("test_user")
+            assert [cp.checkpoint_id for cp in loaded.checkpoints] == [1, 2]
+            assert loaded.checkpoints[-1].commits_range.end_sha == "sha2"
+
+            # A full save rewrites everything and drops the log
+            save_trajectory_cache(loaded)
+            assert not log_file.exists()
+            assert [cp.checkpoint_id for cp in load_trajectory_cache("test_user").checkpoints] == [1, 2]
+
 
 class TestGetCommitsByDate:
     """Test get commits by date functionality."""
@@ -165,6 +239,100 @@ class TestGetCommitsByDate:
             assert "date" in result[0]
             assert "count" in result[0]
 
+    def test_get_commits_by_date_async_matches_sync(self, temp_data_dir):
+        """Test the concurrent variant returns the same buckets as the sync one."""
+        import asyncio
+        from evaluator.services.trajectory_service import get_commits_by_date_async
+
+        repo_dir = temp_data_dir / "github" / "test_owner" / "test_repo"
+        repo_dir.mkdir(parents=True)
+
+        commits_data = [
+            {"sha": "c1", "commit": {"author": {"name": "test_user", "date": "2024-01-02T10:00:00Z"}}},
+            {"sha": "c2", "commit": {"author": {"name": "Test_User", "date": "2024-01-02T23:00:00+08:00"}}},
+            {"sha": "c3", "commit": {"author": {"name": "test_user", "date": "2024-01-05T08:00:00Z"}}},
+            {"sha": "c4", "commit": {"author": {"name": "other_user", "date": "2024-01-05T08:00:00Z"}}},
+            {"sha": "c5", "commit": {"author": {"name": "test_user", "date": "not-a-date"}}},
+        ]
+
+        with open(repo_dir / "commits_list.json", 'w', encoding='utf-8') as f:
+            json.dump(commits_data, f)
+
+        with patch('evaluator.services.trajectory_service.get_platform_data_dir') as mock_get_dir:
+            mock_get_dir.return_value = repo_dir
+            repo_urls = ["https://github.com/test_owner/test_repo"]
+
+            sync_result = get_commits_by_date("test_user", repo_urls, ["test_user"])
+            async_result = asyncio.run(get_commits_by_date_async("test_user", repo_urls, ["test_user"]))
+
+        assert sync_result == [
+            {"date": "2024-01-02", "count": 2},
+            {"date": "2024-01-05", "count": 1},
+        ]
+        assert async_result == sync_result
+
+    def test_count_commits_by_date_reuses_sidecar(self, temp_data_dir):
+        """Test per-day counts are served from the sidecar until the SHA changes."""
+        import asyncio
+        from evaluator.services import trajectory_service
+        from evaluator.services.trajectory_service import count_commits_by_date_async
+
+        repo_dir = temp_data_dir / "github" / "test_owner" / "test_repo"
+        repo_dir.mkdir(parents=True)
+        commits_data = [
+            {"sha": "c1", "commit": {"author": {"name": "test_user", "date": "2024-01-02T10:00:00Z"}}},
+        ]
+        with open(repo_dir / "commits_list.json", 'w', encoding='utf-8') as f:
+            json.dump(commits_data, f)
+
+        repo_urls = ["https://github.com/test_owner/test_repo"]
+        with patch('evaluator.services.trajectory_service.get_platform_data_dir') as mock_get_dir, \
+             patch('evaluator.services.trajectory_service.get_commits_by_date_cache_path') as mock_cache_path, \
+             patch('evaluator.services.trajectory_service._count_repo_commits_by_date',
+                   wraps=trajectory_service._count_repo_commits_by_date) as mock_count:
+            mock_get_dir.return_value = repo_dir
+            mock_cache_path.return_value = temp_data_dir / "sidecar.json"
+
+            first = asyncio.run(count_commits_by_date_async("test_user", repo_urls, [], last_synced_sha="c1"))
+            second = asyncio.run(count_commits_by_date_async("test_user", repo_urls, [], last_synced_sha="c1"))
+            assert mock_count.call_count == 1
+
+            asyncio.run(count_commits_by_date_async("test_user", repo_urls, [], last_synced_sha="c2"))
+            assert mock_count.call_count == 2
+
+        assert first == second == {"2024-01-02": 1}
+
+    def test_count_commits_by_date_skips_sidecar_on_read_error(self, temp_data_dir):
+        """Test a failed repo read is not cached, so the next call recounts."""
+        import asyncio
+        from evaluator.services import trajectory_service
+        from evaluator.services.trajectory_service import count_commits_by_date_async
+
+        repo_dir = temp_data_dir / "github" / "test_owner" / "test_repo"
+        repo_dir.mkdir(parents=True)
+        commits_data = [
+            {"sha": "c1", "commit": {"author": {"name": "test_user", "date": "2024-01-02T10:00:00Z"}}},
+        ]
+        with open(repo_dir / "commits_list.json", 'w', encoding='utf-8') as f:
+            json.dump(commits_data, f)
+
+        repo_urls = ["https://github.com/test_owner/test_repo"]
+        sidecar_path = temp_data_dir / "sidecar.json"
+        with patch('evaluator.services.trajectory_service.get_platform_data_dir') as mock_get_dir, \
+             patch('evaluator.services.trajectory_service.get_commits_by_date_cache_path') as mock_cache_path:
+            mock_get_dir.return_value = repo_dir
+            mock_cache_path.return_value = sidecar_path
+
+            with patch('evaluator.services.trajectory_service.iter_json_array',
+                       side_effect=PermissionError("denied")):
+                failed = asyncio.run(count_commits_by_date_async("test_user", repo_urls, [], last_synced_sha="c1"))
+            assert failed == {}
+            assert not sidecar_path.exists()
+
+            recovered = asyncio.run(count_commits_by_date_async("test_user", repo_urls, [], last_synced_sha="c1"))
+
+        assert recovered == {"2024-01-02": 1}
+
     def test_get_commits_by_date_no_matches(self, temp_data_dir):
         """Test get commits by date with no matching commits."""
         from evaluator.services.trajectory_service import get_commits_by_date
@@ -307,5 +475,30 @@ class TestEnsureRepoDataSynced:
             assert "Unsupported platform" in str(exc_info.value)
 
 
+class TestGroupCommitsByPeriod:
+    """Test 2-week period grouping."""
+
+    def test_group_commits_by_period_with_accumulated(self):
+        """Previously accumulated commits seed the first checkpoint."""
+        from datetime import timezone
+        from evaluator.services.trajectory_service import group_commits_by_period
+
+        commits = [
+            {"sha": f"c{i}", "commit": {"author": {"date": f"2024-01-{i + 1:02d}T10:00:00Z"}}}
+            for i in range(20)
+        ][::-1]
+
+        groups, remaining, _ = group_commits_by_period(
+            commits,
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            accumulated_shas=["c0", "c1"]
+        )
+
+        # c0/c1 lead the first group; days 3-14 form period 0, days 15-20 remain
+        assert [c["sha"] for c in groups[0]] == [f"c{i}" for i in range(14)]
+        assert len(groups) == 1
+        assert remaining == [f"c{i}" for i in range(14, 20)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])